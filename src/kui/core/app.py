@@ -163,8 +163,10 @@ class KamaApplication(metaclass=SingletonMeta):
         Retrieves an existing service or initializes it if it doesn't exist.
         """
 
-        if service_name in self.__services.keys():
-            return self.__services.get(service_name)
+        service = self.__services.get(service_name)
+
+        if service is not None:
+            return service
 
         if service_type is None:
             raise RuntimeError("Can't initialize application service without type.")
@@ -402,11 +402,9 @@ class WidgetManager:
         def remove_widget(window_widget: KamaComponent):
             widget_name = window_widget.metadata.name
 
-            if widget_name not in self.__widgets.keys():
+            if self.__widgets.pop(widget_name, None) is None:
                 return
 
-            del self.__widgets[window_widget.metadata.name]
-
             window_widget.setParent(None)
             window_widget.deleteLater()
 
@@ -46,7 +46,7 @@ class ControllerArgs:
         return self.__args.get(name, default_value)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RefreshEventMetadata:
     """
     Holder for additional refresh event metadata, such as propagation behavior.
@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from kui.core.app import KamaApplication
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Section:
     """
     Data container representing a high-level application section.
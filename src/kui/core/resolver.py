@@ -1,12 +1,17 @@
+import logging
 import re
+from functools import cache
 
 from kutil.logger import get_logger
 from kutil.reflection import get_members
 
 
-__resolvers: dict[str, "ContentResolver"] = {}
 _logger = get_logger(__name__)
 
+# Greedy on purpose - the value may contain nested tokens
+# and should span till the outermost closing brace.
+_TOKEN_REGEX = re.compile(r"(\w+)\{(.*)}")
+
 
 def resolve_content(content: str, resolvers: dict[str, "ContentResolver"] = None):
     """
@@ -35,12 +40,14 @@ def resolve_content(content: str, resolvers: dict[str, "ContentResolver"] = None
         if not isinstance(content, str):
             return content
 
-        match = re.compile(r"(\w+)\{(.*)}").search(content)
+        match = _TOKEN_REGEX.search(content) if "{" in content else None
 
         # If no token has been found then
         # treat it as regular string.
         if not match:
-            _logger.debug("No token found in string '%s'. Content is resolved.", content)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug("No token found in string '%s'. Content is resolved.", content)
+
             return content
 
         full_token = match.group(0)
@@ -63,7 +70,8 @@ def resolve_content(content: str, resolvers: dict[str, "ContentResolver"] = None
             elif len(prop_parts) == 2:
                 value = resolve_content(prop_parts[1].strip(), resolvers)
 
-                if value.isdigit():
+                # Nested tokens may resolve to objects, those are passed as is.
+                if isinstance(value, str) and value.removeprefix("-").isdecimal():
                     value = int(value)
 
                 kw[key] = value
@@ -71,8 +79,11 @@ def resolve_content(content: str, resolvers: dict[str, "ContentResolver"] = None
         resolver_name = f"{token_name.lower()}resolver"
         resolver: ContentResolver = resolvers.get(resolver_name)
 
-        _logger.debug("Resolving content using %s.", resolver.__class__.__name__)
-        _logger.debug("param=%s, args=%s, kw=%s", parameter, args, kw)
+        # Called for every token of every widget, so arguments
+        # aren't even collected unless they'd be logged.
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Resolving content using %s.", resolver.__class__.__name__)
+            _logger.debug("param=%s, args=%s, kw=%s", parameter, args, kw)
         resolved_content = resolver.resolve(parameter, *args, **kw) or ""
 
         # This will allow to have tokenized values together with other text.
@@ -82,11 +93,12 @@ def resolve_content(content: str, resolvers: dict[str, "ContentResolver"] = None
         content = resolved_content
 
 
+@cache
 def get_core_resolvers():
     """
     Returns a global registry of available ContentResolver instances.
 
-    If the registry is empty, it uses reflection to scan the package
+    On first call it uses reflection to scan the package
     for subclasses of ContentResolver and initializes them.
 
     Returns:
@@ -94,26 +106,23 @@ def get_core_resolvers():
                                      class names to their instances.
     """
 
-    global __resolvers
-
-    if len(__resolvers) == 0:
-
-        import kui.resolver as resolver_module
-        from kui.core.app import KamaApplication
+    import kui.resolver as resolver_module
+    from kui.core.app import KamaApplication
 
-        application = KamaApplication()
-        core_package = resolver_module.__package__
-        custom_package = application.config.resolver_package
+    resolvers: dict[str, ContentResolver] = {}
+    application = KamaApplication()
+    core_package = resolver_module.__package__
+    custom_package = application.config.resolver_package
 
-        for member_name, member in get_members(core_package, ContentResolver):
-            _logger.debug("Loading core content resolver with name %s", member_name)
-            __resolvers[member_name.lower()] = member()
+    for member_name, member in get_members(core_package, ContentResolver):
+        _logger.debug("Loading core content resolver with name %s", member_name)
+        resolvers[member_name.lower()] = member()
 
-        for member_name, member in get_members(custom_package, ContentResolver):
-            _logger.debug("Loading custom content resolver with name %s", member_name)
-            __resolvers[member_name.lower()] = member()
+    for member_name, member in get_members(custom_package, ContentResolver):
+        _logger.debug("Loading custom content resolver with name %s", member_name)
+        resolvers[member_name.lower()] = member()
 
-    return __resolvers
+    return resolvers
 
 
 class ContentResolver:
@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from kui.core._service import AppService
@@ -20,10 +21,15 @@ class AppConfigService(AppService, YamlHolder):
         Initializes the service and loads the YAML configuration file.
         """
 
+        # Values with placeholders resolved, keyed by raw value.
+        # Configuration is loaded once and isn't reloaded at runtime,
+        # so remembered values never have to be invalidated.
+        self.__resolved_values: dict[str, str] = {}
+
         AppService.__init__(self, context)
         YamlHolder.__init__(self, os.path.join(get_project_dir(), "kamaconfig"))
 
-    @property
+    @cached_property
     def name(self):
         """
         Returns the application name (Default: 'KamaUI').
@@ -37,56 +43,56 @@ class AppConfigService(AppService, YamlHolder):
         """
         return self.get("application.version")
 
-    @property
+    @cached_property
     def author(self):
         """
         Returns the application author (Default: 'KamaUI').
         """
         return self.get("application.author", "KamaUI")
 
-    @property
+    @cached_property
     def icon(self):
         """
         Returns the application icon path, ensuring .svg extension.
         """
         return self.get("application.icon", SVG.add_extension("application"))
 
-    @property
+    @cached_property
     def default_locale(self):
         """
         Returns the default application locale (Default: 'en_US').
         """
         return self.get("application.locale", "en_US")
 
-    @property
+    @cached_property
     def base_package(self):
         """
         Returns the base package name used for discovery.
         """
         return self.get("application.base-package")
 
-    @property
+    @cached_property
     def component_package(self):
         """
         Returns the package path where components are located.
         """
         return self.get("application.component-package")
 
-    @property
+    @cached_property
     def controller_package(self):
         """
         Returns the package path where controllers are located.
         """
         return self.get("application.controller-package")
 
-    @property
+    @cached_property
     def resolver_package(self):
         """
         Returns the package path where content resolvers are located.
         """
         return self.get("application.resolver-package")
 
-    @property
+    @cached_property
     def startup_package(self):
         """
         Returns the package path for startup-related logic.
@@ -103,6 +109,23 @@ class AppConfigService(AppService, YamlHolder):
         if not isinstance(value, str):
             return value
 
+        # Most values contain no placeholders at all.
+        if "{" not in value:
+            return value
+
+        resolved_value = self.__resolved_values.get(value)
+
+        if resolved_value is None:
+            resolved_value = self.__resolve_placeholders(value)
+            self.__resolved_values[value] = resolved_value
+
+        return resolved_value
+
+    def __resolve_placeholders(self, value: str) -> str:
+        """
+        Replaces placeholders of the configuration value.
+        """
+
         if "{AppDataDirectory}" in value:
             path = value.replace("{AppDataDirectory}", "")
             value = self.application.discovery.app_data(path)
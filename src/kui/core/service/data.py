@@ -1,3 +1,4 @@
+import logging
 from typing import TYPE_CHECKING
 
 from kui.core._service import AppService
@@ -33,5 +34,8 @@ class DataHolderService(AppService):
         """
         Used to add data to holder.
         """
-        _logger.debug("Adding object with name %s to data holder.", object_name)
+
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Adding object with name %s to data holder.", object_name)
+
         self.__data[object_name] = data
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 import os.path
 from kui.util.file import get_project_dir
@@ -25,20 +26,20 @@ class ProjectDiscoveryService(AppService):
             self.TempImages,
             self.Logback,
             self.Logs,
+            self.Cache,
         ]
 
         for directory in directories:
-            if not os.path.exists(directory):
-                os.mkdir(directory)
+            os.makedirs(directory, exist_ok=True)
 
-    @property
+    @cached_property
     def ProjectRoot(self):  # noqa
         """
         Returns the absolute path to the project's root directory.
         """
         return get_project_dir()
 
-    @property
+    @cached_property
     def AppData(self):  # noqa
         """
         Returns the path to the application's data folder within the user's profile.
@@ -47,69 +48,76 @@ class ProjectDiscoveryService(AppService):
         app_data_directory = os.getenv("APPDATA") or ""
         return os.path.join(app_data_directory, self.application.config.name)
 
-    @property
+    @cached_property
     def Resources(self):  # noqa
         """
         Returns the path to the static Resources directory.
         """
         return os.path.join(self.ProjectRoot, "Resources")
 
-    @property
+    @cached_property
     def Styles(self):  # noqa
         """
         Returns the path to the Styles directory within Resources.
         """
         return os.path.join(self.Resources, "Styles")
 
-    @property
+    @cached_property
     def Images(self):  # noqa
         """
         Returns the path to the static Images directory within Resources.
         """
         return os.path.join(self.Resources, "Images")
 
-    @property
+    @cached_property
     def Locales(self):  # noqa
         """
         Returns the path to the static Images directory within Resources.
         """
         return os.path.join(self.Resources, "Locales")
 
-    @property
+    @cached_property
     def Layouts(self):  # noqa
         """
         Returns the path to the static Images directory within Resources.
         """
         return os.path.join(self.Resources, "Layouts")
 
-    @property
+    @cached_property
     def Output(self):  # noqa
         """
         Returns the path to the application's Output directory.
         """
         return os.path.join(self.AppData, "Output")
 
-    @property
+    @cached_property
     def Logback(self):  # noqa
         """
         Returns the path to the application's Logback directory.
         """
         return os.path.join(self.AppData, "Logback")
 
-    @property
+    @cached_property
     def Logs(self):  # noqa
         """
         Returns the path to the application's Logs directory.
         """
         return os.path.join(self.AppData, "Logs")
 
-    @property
+    @cached_property
     def TempImages(self):  # noqa
         """
         Returns the path to the temporary Images directory in AppData.
         """
         return os.path.join(self.AppData, "Images")
 
+    @cached_property
+    def Cache(self):  # noqa
+        """
+        Returns the path to the application's Cache directory.
+        """
+        return os.path.join(self.AppData, "Cache")
+
     def package(self, *paths: str):
         """
         Constructs a dot-notated Python package path starting from the base package.
@@ -188,3 +196,9 @@ class ProjectDiscoveryService(AppService):
         Constructs a path relative to the temporary AppData Images directory.
         """
         return os.path.join(self.TempImages, *paths)
+
+    def cache(self, *paths: str):
+        """
+        Constructs a path relative to the Cache directory.
+        """
+        return os.path.join(self.Cache, *paths)
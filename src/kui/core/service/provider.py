@@ -13,21 +13,22 @@ class DataProviderService(AppService):
 
     def __init__(self, context: "KamaApplicationContext"):
         """
-        Initializes the service with default metadata and section providers.
+        Initializes the service. Default providers are created on first access.
         """
 
         super().__init__(context)
         self.__metadata_provider = None
         self.__section_provider = None
 
-        self.metadata = KMLLayoutProvider()
-        self.section = KMLSectionProvider()
-
     @property
     def metadata(self) -> MetadataProvider:
         """
         Returns the current metadata provider instance.
         """
+
+        if self.__metadata_provider is None:
+            self.metadata = KMLLayoutProvider()
+
         return self.__metadata_provider
 
     @metadata.setter
@@ -44,6 +45,10 @@ class DataProviderService(AppService):
         """
         Returns the current section provider instance.
         """
+
+        if self.__section_provider is None:
+            self.section = KMLSectionProvider()
+
         return self.__section_provider
 
     @section.setter
@@ -1,4 +1,13 @@
 import os
+import pickle
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from importlib.metadata import version, PackageNotFoundError
+from io import BytesIO
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from kamatr.resource import TextTranslation, TextResource
 from kui.core._service import AppService
@@ -7,9 +16,114 @@ from kui.core.provider import Section
 from kui.holder.xml import XMLHolder, XMLTag
 from kui.holder.yaml import YamlHolder
 from kui.style.type import KamaComposedColor, KamaColor, KamaFont, DynamicImage
-from kui.util.file import get_files_from_directory
-from kutil.file import remove_extension_from_path, list_directory
-from kutil.file_type import SVG
+from kui.util.file import get_file_paths_from_directory
+from kutil.file_type import SVG, YAML, YML
+from kutil.logger import get_logger
+
+if TYPE_CHECKING:
+    from kui.core.app import KamaApplicationContext
+
+
+_logger = get_logger(__name__)
+
+# Event metadata is immutable, so single instance is shared by all widgets.
+_RECURSIVE_REFRESH = RefreshEventMetadata(True)
+
+# Should be incremented whenever structure of the cache
+# or of the objects stored in it is changed.
+_CACHE_FORMAT = 3
+
+# Cache is stored in user writable directory, so only
+# classes of the cached resources could be restored.
+_CACHED_CLASSES = frozenset({
+    ("kui.core.provider", "Section"),
+    ("kui.core.metadata", "WidgetMetadata"),
+    ("kui.core.metadata", "ControllerArgs"),
+    ("kui.core.metadata", "RefreshEventMetadata"),
+    ("PyQt6.QtCore", "Qt.AlignmentFlag"),
+    ("datetime", "date"),
+    ("datetime", "datetime"),
+    ("datetime", "timedelta"),
+    ("datetime", "timezone")
+})
+
+# Modules that define how cached resources are built.
+_PARSER_MODULES = (
+    __name__,
+    "kui.core.metadata",
+    "kui.core.provider",
+    "kui.holder.xml",
+    "kui.holder.yaml"
+)
+
+
+def _split(value: str) -> list[str]:
+    """
+    Splits whitespace separated attribute value, most of the attributes are absent.
+    """
+    return value.split() if value else []
+
+
+def _get_parser_fingerprint(paths: list[str]) -> Optional[tuple]:
+    """
+    Returns modification time and size of the provided files,
+    or None if any of them can't be accessed.
+    """
+
+    try:
+        return tuple((file_stat.st_mtime_ns, file_stat.st_size) for file_stat in map(os.stat, paths))
+
+    except (OSError, TypeError):
+        return None
+
+
+@cache
+def _get_cache_version() -> Optional[tuple]:
+    """
+    Returns version of the resource cache.
+    Cache created by a different version of the library or of the parser code is discarded.
+
+    Library version doesn't change during development, so sources of the
+    parser modules are fingerprinted as well. Bundled applications don't have them,
+    executable is used instead. Cache isn't used at all if neither is available.
+    """
+
+    try:
+        library_version = version("kama-ui")
+
+    except PackageNotFoundError:
+        library_version = None
+
+    if getattr(sys, "frozen", False):
+        parser_paths = [sys.executable]
+    else:
+        parser_paths = [getattr(sys.modules.get(module_name), "__file__", None) for module_name in _PARSER_MODULES]
+
+    parser_fingerprint = _get_parser_fingerprint(parser_paths)
+
+    if parser_fingerprint is None:
+        return None
+
+    return library_version, _CACHE_FORMAT, parser_fingerprint
+
+
+class _CacheUnpickler(pickle.Unpickler):
+    """
+    Unpickler that refuses to restore classes other than the ones of cached resources.
+    """
+
+    def find_class(self, module_name: str, name: str):
+        if (module_name, name) not in _CACHED_CLASSES:
+            raise pickle.UnpicklingError(f"{module_name}.{name} is not allowed in resource cache.")
+
+        return super().find_class(module_name, name)
+
+
+def _unpickle(data: bytes):
+    """
+    Restores resource stored in the cache.
+    """
+    return _CacheUnpickler(BytesIO(data)).load()
 
 
 class ResourceReader(AppService):
@@ -19,68 +133,88 @@ class ResourceReader(AppService):
         "grid": "KamaGridLayout"
     }
 
+    def __init__(self, context: "KamaApplicationContext"):
+        super().__init__(context)
+
+        self.__cache = {}
+        self.__updated_cache = {}
+
     def read(self):
+        from kui.resolver.icon import _invalidate_icons
 
         self.application.style.clear()
         self.application.window.manager.clear()
+        _invalidate_icons()
+
+        cache_path = self.application.discovery.cache("resources.pkl")
+        self.__cache = self.__load_cache(cache_path)
+        self.__updated_cache = {}
 
         self.read_layouts()
         self.read_text_resources()
-        self.read_colors()
-        self.read_fonts()
-        self.read_dynamic_images()
+
+        # Style resources are independent files,
+        # so they're loaded together.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            colors, fonts, images = executor.map(
+                self.__read_yaml,
+                [self.application.discovery.resources(file_name) for file_name in ("colors", "fonts", "images")]
+            )
+
+        self.read_colors(colors)
+        self.read_fonts(fonts)
+        self.read_dynamic_images(images)
+
+        # Entries of removed or changed files aren't carried over.
+        if self.__updated_cache != self.__cache:
+            self.__save_cache(cache_path, self.__updated_cache)
+
+        self.__cache = self.__updated_cache
+        self.__updated_cache = {}
 
     def read_layouts(self):
-        section_data = get_files_from_directory(
+        layout_paths = get_file_paths_from_directory(
             self.application.discovery.layouts(),
             recursive=True,
             extension=".kml"
         )
 
-        for section_xml in section_data:
-            section_metadata = XMLHolder(section_xml).root
-
-            if section_metadata.name != "KamaSection":
-                raise RuntimeError("KamaSection should be root tag of the layout.")
-
-            if not section_metadata.has("name"):
-                raise RuntimeError("KamaSection tag doesn't have name property.")
-
-            section = Section(
-                section_id=section_metadata.get("name"),
-                section_label=section_metadata.get("label"),
-                section_icon=section_metadata.get("icon")
-            )
+        # Layouts are parsed independently, only registration
+        # in widget manager has to happen on the calling thread.
+        with ThreadPoolExecutor() as executor:
+            layouts = list(executor.map(lambda path: self.__load_cached(path, self.__read_layout), layout_paths))
 
-            metadata = self.__get_metadata(section_metadata.children, section.section_id)
-            self.application.window.manager.add_section(section, metadata)
+        for layout_sections in layouts:
+            for section, metadata in layout_sections:
+                self.application.window.manager.add_section(section, metadata)
 
     def read_text_resources(self):
-        all_translations = {}
+        all_translations: defaultdict[str, list[TextTranslation]] = defaultdict(list)
+        locale_files = self.__get_locale_files()
 
-        for locale_file in list_directory(self.application.discovery.Locales):
-            locale_name = remove_extension_from_path(locale_file)
-            resources = YamlHolder(self.application.discovery.locales(locale_file)).to_flat_json(join_char="_")
+        with ThreadPoolExecutor() as executor:
+            locale_resources = list(executor.map(
+                lambda locale_file: self.__read_yaml(locale_file[1], flat=True),
+                locale_files
+            ))
 
+        for (locale_name, _), resources in zip(locale_files, locale_resources):
             for key, value in resources.items():
-                translations = all_translations.get(key, [])
-                translations.append(TextTranslation(locale=locale_name, text=value))
-                all_translations[key] = translations
+                all_translations[key].append(TextTranslation(locale=locale_name, text=value))
 
         for key, translations in all_translations.items():
             text_resource = TextResource(key, translations)
             self.application.translations.add(text_resource)
 
-    def read_colors(self):
-        colors_file_name = self.application.discovery.resources("colors")
-        colors = YamlHolder(colors_file_name).to_json()
-        color_map = {}
+    def read_colors(self, colors: dict = None):
+        if colors is None:
+            colors = self.__read_yaml(self.application.discovery.resources("colors"))
+
+        color_map: defaultdict[str, dict[str, str]] = defaultdict(dict)
 
         for theme, theme_colors in colors.items():
             for color_code, color_hex in theme_colors.items():
-                variations = color_map.get(color_code, {})
-                variations[theme] = color_hex
-                color_map[color_code] = variations
+                color_map[color_code][theme] = color_hex
 
         for color_code, variations in color_map.items():
             variations = {theme: KamaColor(color_hex) for theme, color_hex in variations.items()}
@@ -91,9 +225,9 @@ class ResourceReader(AppService):
                 )
             )
 
-    def read_fonts(self):
-        fonts_file_name = self.application.discovery.resources("fonts")
-        fonts = YamlHolder(fonts_file_name).to_json()
+    def read_fonts(self, fonts: dict = None):
+        if fonts is None:
+            fonts = self.__read_yaml(self.application.discovery.resources("fonts"))
 
         for font_code, font_properties in fonts.items():
             font_family = font_properties.get("family")
@@ -109,9 +243,9 @@ class ResourceReader(AppService):
                 )
             )
 
-    def read_dynamic_images(self):
-        images_file_name = self.application.discovery.resources("images")
-        images: dict[str, dict] = YamlHolder(images_file_name).to_json()
+    def read_dynamic_images(self, images: dict[str, dict] = None):
+        if images is None:
+            images = self.__read_yaml(self.application.discovery.resources("images"))
 
         for image_name, image_properties in images.items():
             image_path = image_properties.get("path", image_name)
@@ -125,30 +259,160 @@ class ResourceReader(AppService):
                 )
             )
 
-    def __get_metadata(self, tags: list[XMLTag], section_id: str) -> list[WidgetMetadata]:
+    def __read_layout(self, layout_path: Path) -> list[tuple[Section, list[WidgetMetadata]]]:
+        section_metadata = XMLHolder(layout_path.read_bytes()).root
+
+        if section_metadata.name != "KamaSection":
+            raise RuntimeError("KamaSection should be root tag of the layout.")
+
+        if not section_metadata.has("name"):
+            raise RuntimeError("KamaSection tag doesn't have name property.")
+
+        section = Section(
+            section_metadata.get("name"),
+            section_metadata.get("label"),
+            section_metadata.get("icon")
+        )
+
+        # Template areas are collected first, same as
+        # they're discovered while walking the layout.
+        sections = []
+        metadata = self.__get_metadata(section_metadata.children, section.section_id, sections)
+        sections.append((section, metadata))
+
+        return sections
+
+    def __get_locale_files(self) -> list[tuple[str, str]]:
+        locales_directory = self.application.discovery.Locales
+        extensions = (YAML.extension, YML.extension)
+
+        if not os.path.isdir(locales_directory):
+            return []
+
+        with os.scandir(locales_directory) as entries:
+            return [
+                (os.path.splitext(entry.name)[0], entry.path)
+                for entry in entries
+                if not entry.name.startswith(".") and entry.name.endswith(extensions) and entry.is_file()
+            ]
+
+    def __read_yaml(self, config_path: str, flat: bool = False) -> dict:
+        file_path = YamlHolder.find_file(config_path)
+
+        def build(path: Path):
+            holder = YamlHolder(str(path))
+            return holder.to_flat_json(join_char="_") if flat else holder.to_json()
+
+        # Missing file is reported by the holder itself.
+        if file_path is None:
+            return build(Path(config_path))
+
+        return self.__load_cached(Path(file_path), build)
+
+    def __load_cached(self, path: Path, builder: Callable[[Path], Any]):
+        """
+        Returns result of the builder for the provided file,
+        reusing cached result if file hasn't changed since.
+
+        Cached results are stored pickled, so every call
+        returns fresh objects that are safe to mutate.
+        """
+
+        file_stat = path.stat()
+        cache_key = str(path)
+        signature = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached_entry = self.__cache.get(cache_key)
+
+        if cached_entry is not None and cached_entry[0] == signature:
+            try:
+                result = _unpickle(cached_entry[1])
+
+            except Exception as error:  # noqa
+                _logger.warning("Cached resource %s can't be restored and will be rebuilt: %s", cache_key, error)
+
+            else:
+                self.__updated_cache[cache_key] = cached_entry
+                return result
+
+        result = builder(path)
+
+        try:
+            self.__updated_cache[cache_key] = (signature, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            _logger.warning("Resource %s can't be cached: %s", cache_key, error)
+
+        return result
+
+    @staticmethod
+    def __load_cache(cache_path: str) -> dict:
+
+        if _get_cache_version() is None or not os.path.exists(cache_path):
+            return {}
+
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cache = _CacheUnpickler(cache_file).load()
+
+        except Exception as error:  # noqa
+            _logger.warning("Resource cache %s is corrupted and will be rebuilt: %s", cache_path, error)
+            return {}
+
+        if not isinstance(cache, dict) or cache.get("version") != _get_cache_version():
+            _logger.info("Resource cache %s has been created by a different version and will be rebuilt.", cache_path)
+            return {}
+
+        entries = cache.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def __save_cache(cache_path: str, cache: dict):
+        cache_version = _get_cache_version()
+
+        if cache_version is None:
+            return
+
+        try:
+            with open(cache_path, "wb") as cache_file:
+                cache_content = {"version": cache_version, "entries": cache}
+                pickle.dump(cache_content, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except OSError as error:
+            _logger.warning("Failed to save resource cache %s: %s", cache_path, error)
+
+    def __get_metadata(self, tags: list[XMLTag], section_id: str, sections: list) -> list[WidgetMetadata]:
 
         metadata = []
-        order_id = 0
+        layout_mapping = self.layout_mapping
+
+        # Widgets are numbered within their parent.
+        order_ids: dict[XMLTag, int] = {}
 
-        for tag in tags:
-            parent_id = tag.parent.get("id")
+        # Walk tags in pre-order, so parent widget ID is
+        # always assigned before its children are processed.
+        stack = list(reversed(tags))
+
+        while stack:
+            tag = stack.pop()
+            parent = tag.parent
+            parent_id = parent.get("id")
 
             if tag.name == "Template":
-                self.__process_template(tag)
+                self.__process_template(tag, sections)
                 continue
 
-            widget_id = tag.get("id")
-            layout = tag.get("layout")
-            classes = tag.get("class", "").split()
-            controller_args = {}
+            get = tag.get
+            widget_id = get("id")
+            layout = get("layout")
+            classes = _split(get("class"))
 
-            events = tag.get("refresh_events", "").split()
-            recursive_events = tag.get("recursive_refresh_events", "").split()
+            events = _split(get("refresh_events"))
+            recursive_events = _split(get("recursive_refresh_events"))
 
-            events_meta = {event: RefreshEventMetadata(True) for event in recursive_events}
+            events_meta = dict.fromkeys(recursive_events, _RECURSIVE_REFRESH)
             all_events = events + recursive_events
 
-            order_id += 1
+            order_id = order_ids.get(parent, 0) + 1
+            order_ids[parent] = order_id
 
             if widget_id is None:
                 widget_id = f"{tag.name}_{order_id}"
@@ -158,57 +422,52 @@ class ResourceReader(AppService):
 
                 tag.set("id", widget_id)
 
-            if layout in self.layout_mapping:
-                layout = self.layout_mapping.get(layout)
-
-            for arg_key, arg_value in tag.properties.items():
-                if not arg_key.startswith("arg_"):
-                    continue
-
-                arg_key = arg_key[4:]
-
-                if arg_key.startswith("list_"):
-                    arg_key = arg_key[5:]
-                    arg_value = arg_value.split()
+            if layout in layout_mapping:
+                layout = layout_mapping.get(layout)
 
-                controller_args[arg_key] = arg_value
+            controller_args = {
+                arg_key[9:] if arg_key.startswith("arg_list_") else arg_key[4:]:
+                    arg_value.split() if arg_key.startswith("arg_list_") else arg_value
+                for arg_key, arg_value in tag.properties.items()
+                if arg_key.startswith("arg_")
+            }
 
             meta = WidgetMetadata(
                 widget_id=widget_id,
                 section_id=section_id,
                 widget_type=tag.name,
                 layout_type=layout,
-                grid_columns=tag.get("cols"),
+                grid_columns=get("cols"),
                 parent_widget_id=parent_id,
-                controller=tag.get("controller"),
+                controller=get("controller"),
                 controller_args=controller_args,
                 order_id=order_id,
-                spacing=tag.get("spacing"),
-                width=tag.get("width"),
-                height=tag.get("height"),
-                margin_left=tag.get("ml"),
-                margin_top=tag.get("mt"),
-                margin_right=tag.get("mr"),
-                margin_bottom=tag.get("mb"),
-                alignment_string=tag.get("alignment"),
+                spacing=get("spacing"),
+                width=get("width"),
+                height=get("height"),
+                margin_left=get("ml"),
+                margin_top=get("mt"),
+                margin_right=get("mr"),
+                margin_bottom=get("mb"),
+                alignment_string=get("alignment"),
                 content=tag.content,
-                tooltip=tag.get("tooltip"),
-                stylesheet=tag.get("style", ""),
+                tooltip=get("tooltip"),
+                stylesheet=get("style", ""),
                 refresh_events=all_events,
                 refresh_events_meta=events_meta,
                 classes=classes
             )
 
             metadata.append(meta)
-            metadata.extend(self.__get_metadata(tag.children, section_id))
+            stack.extend(reversed(tag.children))
 
         return metadata
 
-    def __process_template(self, template_tag: XMLTag):
+    def __process_template(self, template_tag: XMLTag, sections: list):
         parent_widget_id = template_tag.parent.get("id")
 
         for template_area in template_tag.children:
             area_section_id = f"{parent_widget_id}__template_{template_area.name.lower()}"
-            area_metadata = self.__get_metadata(template_area.children, area_section_id)
+            area_metadata = self.__get_metadata(template_area.children, area_section_id, sections)
 
-            self.application.window.manager.add_section(Section(area_section_id), area_metadata)
+            sections.append((Section(area_section_id), area_metadata))
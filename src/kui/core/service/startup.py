@@ -1,4 +1,4 @@
-import time
+import threading
 from typing import Optional, TYPE_CHECKING
 
 from PyQt6.QtCore import QThread
@@ -31,6 +31,7 @@ class StartupService(AppService):
 
         self.__startup_threads = []
         self.__finished_tasks = []
+        self.__task_events: dict[str, threading.Event] = {}
 
     def add_task(self, task: "KamaStartupWorker"):
         """
@@ -44,6 +45,10 @@ class StartupService(AppService):
         All workers would be executed in separate threads.
         """
 
+        # Events should exist before any of the workers
+        # are started, since dependents would wait on them.
+        self.__task_events = {task.name: threading.Event() for task in self.__tasks}
+
         if len(self.__tasks) > 0:
             self.application.window.build("wait")
 
@@ -69,6 +74,13 @@ class StartupService(AppService):
         """
         return self.__finished_tasks
 
+    def task_event(self, task_name: str) -> Optional[threading.Event]:
+        """
+        Used to get event that is set
+        once task with provided name is finished.
+        """
+        return self.__task_events.get(task_name)
+
     def __on_worker_finish(self, startup_worker: "KamaStartupWorker"):
         """
         Used to get callback function that gets invoked
@@ -77,6 +89,7 @@ class StartupService(AppService):
 
         def update_execution_info():
             self.__finished_tasks.append(startup_worker.name)
+            self.__task_events[startup_worker.name].set()
             _logger.debug("Startup task %s has been completed.", startup_worker.name)
 
             # If all tasks have been finished then initiate
@@ -119,9 +132,7 @@ class KamaStartupWorker(KamaWorker):
         _logger.debug("Launching startup task %s", self.name)
         _logger.debug("dependencies=%s", self.dependencies)
 
-        while self.__has_unfinished_dependencies():
-            _logger.debug("Task has unfinished dependencies. Sleeping...")
-            time.sleep(0.05)
+        self.__wait_for_dependencies()
 
         super().start()
 
@@ -140,14 +151,19 @@ class KamaStartupWorker(KamaWorker):
         """
         return []
 
-    def __has_unfinished_dependencies(self):
+    def __wait_for_dependencies(self):
         """
-        Used to check if all dependency workers
-        finished its work.
+        Used to block worker until all
+        dependency workers finished its work.
         """
 
         for dependency in self.dependencies:
-            if dependency not in self.__job.finished_tasks:
-                return True
+            dependency_event = self.__job.task_event(dependency)
+
+            if dependency_event is None:
+                _logger.error("Startup task %s depends on unknown task %s.", self.name, dependency)
+                continue
 
-        return False
+            if not dependency_event.is_set():
+                _logger.debug("Task is waiting for %s to finish.", dependency)
+                dependency_event.wait()
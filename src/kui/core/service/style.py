@@ -1,44 +1,141 @@
+import os
 import re
-from functools import cached_property
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
-from copy import deepcopy
 
 from PyQt6.QtCore import Qt
 from kutil.file_type import KSS
 
 from kui.core._service import AppService
 from kui.core.style import ColorMode, StyleResolver
-from kutil.file import read_file, save_file
-from kui.style.type import KamaComposedColor, KamaFont, DynamicImage
+from kui.style.type import KamaColor, KamaComposedColor, KamaFont, DynamicImage
 from kutil.logger import get_logger
-from kutil.number import is_float
-
-from kui.util.file import get_files_from_directory
 
 if TYPE_CHECKING:
     from kui.core.app import KamaApplicationContext
 
 _logger = get_logger(__name__)
+_CLASS_SELECTOR_REGEX = re.compile(r"\.([a-zA-Z0-9_-]+)")
+_SELECTOR_CACHE: dict[str, str] = {}
+_STRUCTURE_REGEX = re.compile(r"[:;{}]")
+_STYLE_TOKEN_REGEX = re.compile(r"(\w+)\(([^)]*)\)")
+_MISSING = object()
+_STYLE_EXTENSIONS = (KSS.extension,)
+
+
+@lru_cache(maxsize=1024)
+def _parse_args(args_string: str) -> tuple:
+    """
+    Converts raw style token arguments string to argument values.
+    Token calls repeat a lot across stylesheet, so results are memoized.
+    """
+    return tuple([_parse_arg(argument) for argument in args_string.split(",")])
+
+
+def _scan_style_files(directory: str | Path) -> list[tuple[str, os.stat_result]]:
+    """
+    Collects stylesheet files located in the provided directory and its subdirectories.
+    Directory entries already carry their type, so only matching files are stat'ed.
+    """
+
+    style_files = []
+    directories = [directory]
+
+    while directories:
+        try:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        directories.append(entry.path)
+
+                    elif entry.name.endswith(_STYLE_EXTENSIONS):
+                        style_files.append((entry.path, entry.stat()))
+
+        except FileNotFoundError:
+            continue
+
+    # Sorted by path components, so the cascade doesn't depend on
+    # directory listing order, which is different on every platform.
+    style_files.sort(key=lambda style_file: style_file[0].split(os.sep))
+    return style_files
 
 
-@dataclass
+def _read_text(path: str | Path) -> str:
+    """
+    Reads the whole file with a single sized read.
+    Stylesheets are small, so buffered file object is just extra syscalls.
+    """
+
+    descriptor = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+    try:
+        size = os.fstat(descriptor).st_size
+        chunks = []
+
+        while size > 0:
+            chunk = os.read(descriptor, size)
+
+            # File has been truncated while reading.
+            if not chunk:
+                break
+
+            chunks.append(chunk)
+            size -= len(chunk)
+
+    finally:
+        os.close(descriptor)
+
+    return b"".join(chunks).decode("utf-8")
+
+
+def _parse_arg(argument: str):
+    """
+    Converts raw style token argument to its value.
+    Quoted arguments are treated as strings, otherwise number conversion is attempted.
+    """
+
+    argument = argument.strip()
+
+    if argument[:1] in ("'", '"'):
+        return argument[1:-1]
+
+    try:
+        return int(argument)
+    except ValueError:
+        pass
+
+    try:
+        return float(argument)
+    except ValueError:
+        return argument
+
+
+@dataclass(slots=True)
 class StyleProperty:
     name: str
     value: str
 
-    @property
-    def qss(self):
-        return f"{self.name}: {self.value};"
-
 
 class StyleBlock:
 
+    __slots__ = ("__selector", "__properties", "__qss")
+
     def __init__(self, selector: str, properties: list[StyleProperty]):
-        self.__selector = re.sub(r"\.([a-zA-Z0-9_-]+)", r"[cls-\1='true']", selector.strip())
+        selector = selector.strip()
+        qss_selector = _SELECTOR_CACHE.get(selector)
+
+        if qss_selector is None:
+            qss_selector = _CLASS_SELECTOR_REGEX.sub(r"[cls-\1='true']", selector)
+            _SELECTOR_CACHE[selector] = qss_selector
+
+        self.__selector = qss_selector
         self.__properties = properties
+        self.__qss = None
 
-    @cached_property
+    @property
     def selector(self) -> str:
         return self.__selector
 
@@ -48,12 +145,13 @@ class StyleBlock:
 
     @property
     def qss(self) -> str:
-        properties_style = ""
-
-        for prop in self.__properties:
-            properties_style += f"\t{prop.qss}\n"
+        # Properties are resolved before block is created,
+        # so its text doesn't change afterward.
+        if self.__qss is None:
+            properties_style = "".join([f"\t{prop.name}: {prop.value};\n" for prop in self.__properties])
+            self.__qss = f"{self.__selector} {{\n{properties_style}}}\n\n"
 
-        return f"{self.selector} {{\n{properties_style}}}\n\n"
+        return self.__qss
 
     def __add__(self, other):
         if isinstance(other, str):
@@ -70,9 +168,6 @@ class StyleBuilder(AppService):
     Service responsible for loading QSS files and resolving style tokens.
     """
 
-    __BLOCK_REGEX = r"(?m)^[ \t]*([^{;]+?)\s*\{((?:[^{}]|\{(?:[^{}]|\{[^{}]*\})*\})*)\}"
-    __PROPERTY_REGEX = r"([\w-]+)\s*:\s*([^;]+)"
-
     def __init__(self, context: "KamaApplicationContext"):
         """
         Initializes the StyleBuilder with an empty registry of resolvers.
@@ -80,6 +175,10 @@ class StyleBuilder(AppService):
 
         super().__init__(context)
         self.__resolvers: dict[str, StyleResolver] = {}
+        self.__resolve_cache: dict[str, str] = {}
+        self.__parse_cache: dict[str, tuple[tuple[int, int], list[tuple[str, list[tuple[str, str]]]]]] = {}
+        self.__style_blocks: list[StyleBlock] | None = None
+        self.__is_volatile = False
 
     def add_resolver(self, resolver: StyleResolver):
         """
@@ -89,42 +188,99 @@ class StyleBuilder(AppService):
         resolver_name = resolver.__class__.__name__.replace("Resolver", "").lower()
         resolver.application = self.application
         self.__resolvers[resolver_name] = resolver
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Drops cached token values.
+        Should be called whenever data resolvers rely on changes.
+        """
+
+        self.__resolve_cache.clear()
+        self.__style_blocks = None
 
     def load_stylesheet(self, directory: str) -> list[StyleBlock]:
         """
         Load all stylesheets recursively using Traversable API.
         Works for both standard OS paths and bundled resources.
+
+        Stylesheets are concatenated in order of their paths, compared directory
+        by directory ('base/widget.kss' goes before 'theme.kss'), so blocks
+        of the later file take precedence for the same selector.
         """
 
-        style_files: list[str] = get_files_from_directory(directory, recursive=True, extension=KSS.extension)
+        style_files = _scan_style_files(directory)
+        parse_cache = {}
+        changed_files = []
+
+        for style_file, file_stat in style_files:
+            signature = (file_stat.st_mtime_ns, file_stat.st_size)
+            cached_entry = self.__parse_cache.get(style_file)
+
+            if cached_entry is not None and cached_entry[0] == signature:
+                parse_cache[style_file] = cached_entry
+            else:
+                changed_files.append((style_file, signature))
+
+        # Only reading is done concurrently, parsing stays on the calling thread.
+        if len(changed_files) > 0:
+            with ThreadPoolExecutor(max_workers=min(8, len(changed_files))) as executor:
+                style_strings = executor.map(
+                    lambda changed_file: _read_text(changed_file[0]),
+                    changed_files
+                )
+
+                for (style_file, signature), style_string in zip(changed_files, style_strings):
+                    parse_cache[style_file] = (signature, self.__parse_qss(style_string))
+
+        # Neither files nor values they resolve to have changed since last load.
+        if len(changed_files) == 0 and self.__style_blocks is not None and parse_cache.keys() == self.__parse_cache.keys():
+            return list(self.__style_blocks)
+
+        # Entries of deleted files are dropped.
+        self.__parse_cache = parse_cache
+        self.__is_volatile = False
         style_blocks: list[StyleBlock] = []
 
-        for style_string in style_files:
-            entry_blocks = self.__parse_qss(style_string)
-
-            for block in entry_blocks:
-                for prop in block.properties:
-                    prop.value = self.resolve(prop.value)
+        # Blocks are built from raw values every time,
+        # since resolved values depend on current style data.
+        for style_file, _ in style_files:
+            for selector, props in parse_cache[style_file][1]:
+                properties = [
+                    StyleProperty(name, self.resolve(value) if "(" in value else value)
+                    for name, value in props
+                ]
+                style_blocks.append(StyleBlock(selector, properties))
+
+        # Values of non cacheable resolvers might be different next time.
+        self.__style_blocks = None if self.__is_volatile else style_blocks
+        return list(style_blocks)
+
+    def __parse_qss(self, stylesheet: str) -> list[tuple[str, list[tuple[str, str]]]]:
+        blocks = []
 
-                style_blocks.append(block)
+        # Nested blocks are expanded depth first, so every block is
+        # directly followed by its own nested blocks, same as in the source.
+        stack = [(self.__read_blocks(stylesheet), "")]
 
-        return style_blocks
+        while stack:
+            string_blocks, parent_selector = stack[-1]
+            string_block = next(string_blocks, None)
 
-    def __parse_qss(self, stylesheet: str, parent_selector: str = "") -> list[StyleBlock]:
-        string_blocks = self.__read_blocks(stylesheet)
-        blocks = []
+            if string_block is None:
+                stack.pop()
+                continue
 
-        for block, selector, content, props in string_blocks:
+            selector, content, props = string_block
             selector = selector.replace("&", parent_selector)
 
-            blocks.append(StyleBlock(selector, [StyleProperty(name, value) for name, value in props]))
-            blocks.extend(self.__parse_qss(content, selector))
+            blocks.append((selector, props))
+            stack.append((self.__read_blocks(content), selector))
 
         return blocks
 
     @staticmethod
     def __read_blocks(stylesheet: str):
-        blocks = []
         properties = []
 
         depth = 0
@@ -137,102 +293,117 @@ class StyleBuilder(AppService):
         property_value_start = -1
         property_found = False
 
-        for current_char_index, char in enumerate(stylesheet):
-            next_char_index = current_char_index + 1
+        # Only structural characters affect parser state, so the rest of
+        # the text is skipped by regex engine instead of being walked here.
+        # Most of them are inside first level blocks, so property parsing branch goes first.
+        for match in _STRUCTURE_REGEX.finditer(stylesheet):
+            current_char_index = match.start()
+            char = match.group()
 
-            # Process properties.
             if depth == 1:
-                if char == ":" and not property_found:
-                    property_key_end = current_char_index
-                    property_value_start = next_char_index
+                if char == ":":
+                    if not property_found:
+                        property_key_end = current_char_index
+                        property_value_start = current_char_index + 1
 
-                    property_found = True
+                        property_found = True
 
                 elif char == ";":
                     property_key = stylesheet[property_key_start:property_key_end].strip()
                     property_value = stylesheet[property_value_start:current_char_index].strip()
                     properties.append((property_key, property_value))
 
-                    property_key_start = next_char_index
+                    property_key_start = current_char_index + 1
+                    property_found = False
+
+                elif char == "{":
+                    depth = 2
+                    # Reset property identification flag once we get
+                    # deeper into block stylesheet, since it may mess up
+                    # consequent properties by treating block selectors with :
+                    # as properties.
                     property_found = False
 
-            # Assume that after each property on first level
-            # goes nested style block.
-            if depth == 0 and char == ";":
-                selector_start = next_char_index
+                elif char == "}":
+                    depth = 0
 
-            if char == "{":
+                    selector = stylesheet[selector_start:content_start].strip()
+                    content = stylesheet[content_start + 1:current_char_index].strip()
+
+                    yield selector, content, properties
+                    properties = []
+
+                    # Change starting position of next block.
+                    # We will assume that it goes right after this one.
+                    selector_start = current_char_index + 1
+
+            elif depth == 0:
+                # Assume that after each property on first level
+                # goes nested style block.
+                if char == ";":
+                    selector_start = current_char_index + 1
 
                 # When we step into first level block
                 # then mark character as beginning of block
                 # as well as beginning of first property key.
-                if depth == 0:
+                elif char == "{":
                     content_start = current_char_index
-                    property_key_start = next_char_index
+                    property_key_start = current_char_index + 1
 
+                    depth = 1
+                    property_found = False
+
+                elif char == "}":
+                    depth = -1
+
+            # Nested blocks are only tracked by depth,
+            # they're processed once parent block is read.
+            elif char == "{":
                 depth += 1
-                # Reset property identification flag once we get
-                # deeper into block stylesheet, since it may mess up
-                # consequent properties by treating block selectors with :
-                # as properties.
                 property_found = False
 
             elif char == "}":
                 depth -= 1
 
-                if depth == 0:
-                    block = stylesheet[selector_start:next_char_index].strip()
-                    selector = stylesheet[selector_start:content_start].strip()
-                    content = stylesheet[content_start + 1:current_char_index].strip()
-
-                    blocks.append((block, selector, content, deepcopy(properties)))
-                    properties.clear()
-
-                    # Change starting position of next block.
-                    # We will assume that it goes right after this one.
-                    selector_start = next_char_index
-
-        return blocks
-
     def resolve(self, style_string: str):
         """
         Used to resolve color/font
         properties in string.
         """
 
-        resolved_values = []
+        # Most of the values are plain, there's nothing to resolve.
+        if "(" not in style_string:
+            return style_string
 
-        for match in re.finditer(r"(\w+?(?=\())\((.*?(?=\)))\)", style_string):
-            value = match.group(0)
-            token = match.group(1)
-            args_string = match.group(2)
-            resolver = self.__resolvers.get(token)
+        return _STYLE_TOKEN_REGEX.sub(self.__resolve_token, style_string)
 
-            if resolver is None:
-                _logger.error("Resolver for token '%s' was not found.", token)
-                continue
+    def __resolve_token(self, match: re.Match) -> str:
+        """
+        Resolves single style token, leaves it as is if there is no resolver for it.
+        """
 
-            if value in resolved_values:
-                continue
+        value = match.group(0)
+        resolved_value = self.__resolve_cache.get(value)
 
-            raw_args = [arg.strip() for arg in args_string.split(",")]
-            args = []
+        if resolved_value is not None:
+            return resolved_value
 
-            for argument in raw_args:
-                if argument.isdigit():
-                    args.append(int(argument))
+        token = match.group(1)
+        args_string = match.group(2)
+        resolver = self.__resolvers.get(token)
 
-                elif is_float(argument):
-                    args.append(float(argument))
+        if resolver is None:
+            _logger.error("Resolver for token '%s' was not found.", token)
+            return value
 
-                else:
-                    args.append(argument[1:-1])
+        resolved_value = resolver.resolve(*_parse_args(args_string))
 
-            resolved_value = resolver.resolve(*args)
-            style_string = style_string.replace(value, resolved_value)
-            resolved_values.append(value)
+        if resolver.cacheable:
+            self.__resolve_cache[value] = resolved_value
+        else:
+            self.__is_volatile = True
 
-        return style_string
+        return resolved_value
 
 
 class StyleManagerService(AppService):
@@ -248,7 +419,12 @@ class StyleManagerService(AppService):
         super().__init__(context)
 
         self.__color_mode = None
+        self.__system_color_mode = None
+        self.__subscribed_to_color_scheme = False
+        self.__color_cache: dict[tuple[str, str], KamaColor | None] = {}
         self.__dynamic_images: list[DynamicImage] = []
+        self.__generated_images: dict[str, tuple[str, int, str]] = {}
+        self.__image_sources: dict[str, tuple[int, bytes]] = {}
         self.__style_builder = StyleBuilder(context)
 
         self.__fonts: dict[str, KamaFont] = {}
@@ -258,6 +434,7 @@ class StyleManagerService(AppService):
         self.__dynamic_images.clear()
         self.__fonts.clear()
         self.__colors.clear()
+        self.__invalidate_cache()
 
     @property
     def color_mode(self):
@@ -268,30 +445,45 @@ class StyleManagerService(AppService):
         if self.__color_mode is not None:
             return self.__color_mode
 
-        return self.__get_system_color_mode()
+        if self.__system_color_mode is None:
+            self.__system_color_mode = self.__get_system_color_mode()
+
+        return self.__system_color_mode
 
     @color_mode.setter
     def color_mode(self, color_mode: str):
         """
         Manually sets the application color mode (e.g., 'light' or 'dark').
         """
+
         self.__color_mode = color_mode
+        self.__invalidate_cache()
 
     def get_color(self, color_code: str):
         """
         Retrieves the appropriate color from a composed color object based on the current mode.
         """
 
+        cache_key = (color_code, self.color_mode)
+        variation = self.__color_cache.get(cache_key, _MISSING)
+
+        if variation is not _MISSING:
+            return variation
+
         color = self.__colors.get(color_code)
 
+        # Unknown codes are remembered as well, since the
+        # same literal value is usually looked up repeatedly.
         if not color:
+            self.__color_cache[cache_key] = None
             return None
 
-        variation = color.get(self.color_mode)
+        variation = color.get(cache_key[1])
 
         if variation is None:
             variation = color.default
 
+        self.__color_cache[cache_key] = variation
         return variation
 
     @property
@@ -312,13 +504,17 @@ class StyleManagerService(AppService):
         """
         Adds a font definition to the manager.
         """
+
         self.__fonts[font.font_code] = font
+        self.__style_builder.clear_cache()
 
     def add_color(self, color: KamaComposedColor):
         """
         Adds a composed color definition (light/dark pair) to the manager.
         """
+
         self.__colors[color.color_code] = color
+        self.__invalidate_cache()
 
     def add_dynamic_image(self, image: DynamicImage):
         """
@@ -338,6 +534,8 @@ class StyleManagerService(AppService):
         difference is color.
         """
 
+        is_generated = False
+
         for image in self.__dynamic_images:
             current_color = image.color_code
             resolved_color = self.get_color(image.color_code)
@@ -346,23 +544,82 @@ class StyleManagerService(AppService):
                 current_color = resolved_color
 
             image_path = self.application.discovery.images(image.image_path, include_temporary=False)
-            image_content = read_file(image_path)
+            temp_image_path = self.application.discovery.temp_images(image.image_name)
+            color_hex = current_color.color_hex if current_color is not None else None
+            image_mtime = os.stat(image_path).st_mtime_ns
+            signature = (image_path, image_mtime, color_hex)
 
-            if current_color is not None:
-                image_content = image_content.replace("currentColor", current_color.color_hex)
+            # Image has already been generated from the same source and color.
+            if self.__generated_images.get(temp_image_path) == signature and os.path.exists(temp_image_path):
+                continue
 
-            temp_image_path = self.application.discovery.temp_images(image.image_name)
-            save_file(temp_image_path, image_content)
+            image_content = self.__get_image_source(image_path, image_mtime)
+
+            # Color is plain ASCII hex, so content doesn't need to be decoded.
+            if color_hex is not None:
+                image_content = image_content.replace(b"currentColor", color_hex.encode("ascii"))
+
+            temp_image = Path(temp_image_path)
+            temp_image.parent.mkdir(parents=True, exist_ok=True)
+            temp_image.write_bytes(image_content)
+            self.__generated_images[temp_image_path] = signature
+            is_generated = True
+
+        # Image paths are resolved to generated images once they exist.
+        if is_generated:
+            self.__style_builder.clear_cache()
+
+    def __get_image_source(self, image_path: str, image_mtime: int) -> bytes:
+        """
+        Returns contents of the source image,
+        reading it from disk only if it has changed.
+
+        Usually only color changes between rebuilds,
+        so source images are read once.
+        """
+
+        cached_source = self.__image_sources.get(image_path)
+
+        if cached_source is not None and cached_source[0] == image_mtime:
+            return cached_source[1]
+
+        image_content = Path(image_path).read_bytes()
+        self.__image_sources[image_path] = (image_mtime, image_content)
+
+        return image_content
 
     def __get_system_color_mode(self):
         """
         Used to get current color mode.
+        Subscribes to system color scheme changes on first call
+        so the cached mode is dropped once it changes.
         """
 
         mode = ColorMode.Light
-        color_scheme = self.application.window.qt_application.styleHints().colorScheme()  # noqa
+        style_hints = self.application.window.qt_application.styleHints()
+        color_scheme = style_hints.colorScheme()  # noqa
+
+        if not self.__subscribed_to_color_scheme:
+            style_hints.colorSchemeChanged.connect(self.__on_color_scheme_change)  # noqa
+            self.__subscribed_to_color_scheme = True
 
         if color_scheme == Qt.ColorScheme.Dark:
             mode = ColorMode.Dark
 
         return mode
+
+    def __on_color_scheme_change(self, *_):
+        """
+        Drops cached system color mode and resolved colors.
+        """
+
+        self.__system_color_mode = None
+        self.__invalidate_cache()
+
+    def __invalidate_cache(self):
+        """
+        Drops resolved colors along with style tokens that were resolved using them.
+        """
+
+        self.__color_cache.clear()
+        self.__style_builder.clear_cache()
@@ -8,6 +8,9 @@ if TYPE_CHECKING:
     from kui.core.app import KamaApplicationContext
 
 
+_MISSING = object()
+
+
 class TextResourceService(AppService, TextResourceManager):
     """
     Service responsible for managing localized text and translation resources.
@@ -18,6 +21,9 @@ class TextResourceService(AppService, TextResourceManager):
         Initializes the service and the underlying text resource manager.
         """
 
+        # Translations of argumentless lookups, keyed by locale and resource key.
+        self.__cache: dict[tuple[str, str], str] = {}
+
         AppService.__init__(self, context)
         TextResourceManager.__init__(self, provider)
 
@@ -27,3 +33,40 @@ class TextResourceService(AppService, TextResourceManager):
         Returns the active locale, falling back to the application default if not set.
         """
         return super().locale or self.application.config.default_locale
+
+    @locale.setter
+    def locale(self, locale: str):
+        """
+        Changes the active locale, dropping remembered translations.
+        """
+
+        self.__cache.clear()
+        super(TextResourceService, type(self)).locale.fset(self, locale)
+
+    def get(self, text_resource_key: str, *args, **kwargs):
+        """
+        Returns translation of the text resource for the active locale.
+
+        Most of the lookups are labels without any arguments,
+        their translations are remembered until resources change.
+        """
+
+        if args or kwargs:
+            return super().get(text_resource_key, *args, **kwargs)
+
+        cache_key = (self.locale, text_resource_key)
+        text = self.__cache.get(cache_key, _MISSING)
+
+        if text is _MISSING:
+            text = super().get(text_resource_key)
+            self.__cache[cache_key] = text
+
+        return text
+
+    def add(self, *args, **kwargs):
+        """
+        Registers text resource, dropping remembered translations.
+        """
+
+        self.__cache.clear()
+        return super().add(*args, **kwargs)
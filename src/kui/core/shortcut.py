@@ -1,7 +1,37 @@
-from typing import Any
+from typing import Any, Callable, Optional
 from kui.core.app import KamaApplication
 
 
+_application: Optional[KamaApplication] = None
+_translate: Optional[Callable[..., str]] = None
+
+
+def _get_application() -> KamaApplication:
+    """
+    Returns application instance.
+    Application is a singleton, so it's looked up only once.
+    """
+
+    global _application
+
+    if _application is None:
+        _application = KamaApplication()
+
+    return _application
+
+
+def _invalidate_shortcuts():
+    """
+    Drops application instance and its services remembered by shortcuts.
+    Should be called once application instance is replaced.
+    """
+
+    global _application, _translate
+
+    _application = None
+    _translate = None
+
+
 def tr(text_resource_key: str, *args):
     """
     Retrieves a localized string based on the provided key.
@@ -13,7 +43,15 @@ def tr(text_resource_key: str, *args):
     Returns:
         str: The translated and formatted string.
     """
-    return KamaApplication().translations.get(text_resource_key, *args)
+
+    global _translate
+
+    # Translation service lives as long as application,
+    # so its lookup method is resolved only once.
+    if _translate is None:
+        _translate = _get_application().translations.get
+
+    return _translate(text_resource_key, *args)
 
 
 def dynamic_data(object_name: str):
@@ -26,7 +64,7 @@ def dynamic_data(object_name: str):
     Returns:
         Any: The data object if found, otherwise None.
     """
-    return KamaApplication().data.get(object_name)
+    return _get_application().data.get(object_name)
 
 
 def add_dynamic_data(object_name: str, value: Any):
@@ -37,7 +75,7 @@ def add_dynamic_data(object_name: str, value: Any):
         object_name (str): The name to associate with the value.
         value (Any): The data to be stored.
     """
-    KamaApplication().data.add(object_name, value)
+    _get_application().data.add(object_name, value)
 
 
 def prop(property_name: str, default_value: Any = None):
@@ -51,7 +89,7 @@ def prop(property_name: str, default_value: Any = None):
     Returns:
         Any: The configuration value.
     """
-    return KamaApplication().config.get(property_name, default_value)
+    return _get_application().config.get(property_name, default_value)
 
 
 def resolve_project_file(*paths: str):
@@ -64,7 +102,7 @@ def resolve_project_file(*paths: str):
     Returns:
         str: The absolute path within the project root.
     """
-    return KamaApplication().discovery.project(*paths)
+    return _get_application().discovery.project(*paths)
 
 
 def resolve_image(*paths: str, include_temporary: bool = True):
@@ -78,7 +116,7 @@ def resolve_image(*paths: str, include_temporary: bool = True):
     Returns:
         str: The absolute path to the image file.
     """
-    return KamaApplication().discovery.images(*paths, include_temporary=include_temporary)
+    return _get_application().discovery.images(*paths, include_temporary=include_temporary)
 
 
 def resolve_temp_file(*paths: str):
@@ -91,7 +129,7 @@ def resolve_temp_file(*paths: str):
     Returns:
         str: The absolute path to the output directory.
     """
-    return KamaApplication().discovery.output(*paths)
+    return _get_application().discovery.output(*paths)
 
 
 def resolve_temp_image(*paths: str):
@@ -104,7 +142,7 @@ def resolve_temp_image(*paths: str):
     Returns:
         str: The absolute path to the temporary 'Images' directory.
     """
-    return KamaApplication().discovery.temp_images(*paths)
+    return _get_application().discovery.temp_images(*paths)
 
 
 def resolve_app_data(*paths: str):
@@ -117,7 +155,7 @@ def resolve_app_data(*paths: str):
     Returns:
         str: The absolute path to the application data root.
     """
-    return KamaApplication().discovery.app_data(*paths)
+    return _get_application().discovery.app_data(*paths)
 
 
 def resolve_log(*paths: str):
@@ -130,7 +168,7 @@ def resolve_log(*paths: str):
     Returns:
         str: The absolute path to the 'Logs' directory.
     """
-    return KamaApplication().discovery.logs(*paths)
+    return _get_application().discovery.logs(*paths)
 
 
 def resolve_logback(*paths: str):
@@ -144,4 +182,4 @@ def resolve_logback(*paths: str):
     Returns:
         str: The absolute path to the logback configuration.
     """
-    return KamaApplication().discovery.logback(*paths)
+    return _get_application().discovery.logback(*paths)
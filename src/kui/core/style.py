@@ -16,8 +16,16 @@ class ColorMode:
 class StyleResolver:
     """
     Base class for resolving custom tokens in stylesheets.
+
+    Resolvers are called for every token occurrence, unless they set
+    'cacheable' to True, in which case resolved values are reused
+    until style data (colors, fonts, color mode) changes.
     """
 
+    # Whether resolved value depends only on token arguments
+    # and application style data (colors, fonts, color mode, dynamic images).
+    cacheable: bool = False
+
     def __init__(self):
         """
         Initializes the resolver with an empty application reference.
@@ -1,4 +1,5 @@
 import sys
+from functools import cached_property
 from typing import Callable, TYPE_CHECKING
 
 from PyQt6.QtCore import pyqtSignal, QSettings
@@ -53,6 +54,8 @@ class KamaWindow(AppService, QMainWindow):
 
         self.__is_ui_blocked = False
         self.__is_initialized = False
+        self.__stylesheet = None
+        self.__user_window_size = None
 
         self.setWindowTitle(self.application.config.name)
         icon_path = self.application.discovery.images(self.application.config.icon)
@@ -66,7 +69,7 @@ class KamaWindow(AppService, QMainWindow):
         """
         self.__qt_application.exec()
 
-    @property
+    @cached_property
     def window_width(self):
         """
         Returns the default window width from configuration.
@@ -76,7 +79,7 @@ class KamaWindow(AppService, QMainWindow):
         """
         return self.application.config.get("window.width", 1920)
 
-    @property
+    @cached_property
     def window_height(self):
         """
         Returns the default window height from configuration.
@@ -86,7 +89,7 @@ class KamaWindow(AppService, QMainWindow):
         """
         return self.application.config.get("window.height", 1080)
 
-    @property
+    @cached_property
     def min_width(self):
         """
         Returns the minimum allowed window width.
@@ -96,7 +99,7 @@ class KamaWindow(AppService, QMainWindow):
         """
         return self.application.config.get("window.min-width", 1080)
 
-    @property
+    @cached_property
     def min_height(self):
         """
         Returns the minimum allowed window height.
@@ -106,6 +109,27 @@ class KamaWindow(AppService, QMainWindow):
         """
         return self.application.config.get("window.min-height", 720)
 
+    @property
+    def user_window_size(self) -> tuple[int, int]:
+        """
+        Returns window size persisted by user,
+        falling back to default size from configuration.
+
+        Settings are only written on close,
+        so they're read once.
+
+        Returns:
+            tuple[int, int]: Window width and height.
+        """
+
+        if self.__user_window_size is None:
+            self.__user_window_size = (
+                self.__settings.value("windowWidth", self.window_width, int),
+                self.__settings.value("windowHeight", self.window_height, int)
+            )
+
+        return self.__user_window_size
+
     @property
     def qt_application(self):
         """
@@ -154,12 +178,21 @@ class KamaWindow(AppService, QMainWindow):
         Combines and applies core and user stylesheets to the application.
         """
 
+        # Images are generated first, so stylesheet refers to them.
+        self.application.style.create_dynamic_images()
+
         user_stylesheet_directory = Path(self.application.discovery.Styles)
-        user_stylesheet = self.application.style.builder.load_stylesheet(user_stylesheet_directory)
-        user_stylesheet = "".join([f"{block.qss}\n" for block in user_stylesheet])
+        style_blocks = self.application.style.builder.load_stylesheet(user_stylesheet_directory)
+        user_stylesheet = "\n".join([block.qss for block in style_blocks])
+
+        # Applying stylesheet makes Qt re-polish every widget,
+        # so it's skipped when nothing has changed since last build.
+        if user_stylesheet == self.__stylesheet:
+            _logger.debug("Stylesheet hasn't changed, skipping.")
+            return
 
-        self.application.style.create_dynamic_images()
         self.__qt_application.setStyleSheet(user_stylesheet)
+        self.__stylesheet = user_stylesheet
 
     def build(self, section: str = "root"):
         """
@@ -264,11 +297,18 @@ class KamaWindow(AppService, QMainWindow):
             event (QCloseEvent): The close event instance.
         """
 
-        _logger.debug("Persisting window geometry in registry.")
-        _logger.debug("width=%s, height=%s", self.width(), self.height())
+        window_size = (self.width(), self.height())
+
+        # Registry is only touched when window has been resized.
+        if window_size != self.user_window_size:
+            _logger.debug("Persisting window geometry in registry.")
+            _logger.debug("width=%s, height=%s", *window_size)
+
+            self.__settings.setValue("windowWidth", window_size[0])
+            self.__settings.setValue("windowHeight", window_size[1])
+            self.__settings.sync()
 
-        self.__settings.setValue("windowWidth", self.width())
-        self.__settings.setValue("windowHeight", self.height())
+            self.__user_window_size = window_size
 
         # Cleanup AppData directories.
         directories = [
@@ -287,8 +327,7 @@ class KamaWindow(AppService, QMainWindow):
         Adjusts the window size based on user settings or defaults.
         """
 
-        user_screen_width = self.__settings.value("windowWidth", self.window_width)
-        user_screen_height = self.__settings.value("windowHeight", self.window_height)
+        user_screen_width, user_screen_height = self.user_window_size
 
         self.setMinimumSize(self.min_width, self.min_height)
         self.resize(user_screen_width, user_screen_height)
@@ -299,13 +338,13 @@ class KamaWindow(AppService, QMainWindow):
         Will ensure that each time app opened it's in the center of screen.
         """
 
-        screen_width = QApplication.primaryScreen().size().width()
-        screen_height = QApplication.primaryScreen().size().height()
+        screen_size = QApplication.primaryScreen().size()
+        screen_width = screen_size.width()
+        screen_height = screen_size.height()
 
-        user_screen_width = self.__settings.value("windowWidth", self.window_width)
-        user_screen_height = self.__settings.value("windowHeight", self.window_height)
+        user_screen_width, user_screen_height = self.user_window_size
 
-        x = int((screen_width - user_screen_width) / 2)
-        y = int((screen_height - user_screen_height) / 2)
+        x = (screen_width - user_screen_width) // 2
+        y = (screen_height - user_screen_height) // 2
 
         self.move(x, y)
@@ -1,7 +1,9 @@
+import json
 import os
+from pathlib import Path
 from typing import Any
 
-from kutil.file import read_file, save_file
+from kutil.file import save_file
 from kutil.file_type import JSON
 
 
@@ -59,7 +61,7 @@ class JsonConfigHolder:
 
         Needed for testing purposes.
         """
-        self._data = read_file(self._config_path, as_json=True)
+        self._data = json.loads(Path(self._config_path).read_bytes())
 
     def _before_file_open(self):
         """
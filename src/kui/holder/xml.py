@@ -1,9 +1,16 @@
-from functools import cached_property
+import re
+from io import BytesIO
 from lxml import etree
 
 
+# Declared encoding no longer applies once text has been decoded.
+_DECLARATION_REGEX = re.compile(r"^\s*<\?xml[^>]*\?>")
+
+
 class XMLTag:
 
+    __slots__ = ("__name", "__parent", "__content", "__properties", "__children")
+
     def __init__(self, name: str, parent: XMLTag):
         self.__name = name
         self.__parent = parent
@@ -11,7 +18,7 @@ class XMLTag:
         self.__properties = {}
         self.__children = []
 
-    @cached_property
+    @property
     def name(self):
         return self.__name
 
@@ -65,23 +72,51 @@ class XMLTag:
 
 class XMLHolder:
 
-    def __init__(self, content: str):
-        xml_data = etree.fromstring(content, parser=etree.XMLParser(remove_comments=True))  # noqa
-        self.__root = self.__process_xml(xml_data)
+    def __init__(self, content: str | bytes):
+        self.__root = None
+        self.__process_xml(content)
 
     @property
     def root(self):
         return self.__root
 
-    def __process_xml(self, element, parent_tag: XMLTag = None) -> XMLTag:
-        tag = XMLTag(element.tag, parent_tag)
+    def __process_xml(self, content: str | bytes):
+        stack: list[XMLTag] = []
+
+        # Raw file content is preferred, so parser could honor declared encoding.
+        if isinstance(content, str):
+            content = _DECLARATION_REGEX.sub("", content, count=1).encode("utf-8")
+
+        events = etree.iterparse(
+            BytesIO(content),
+            events=("start", "end"),
+            remove_comments=True
+        )
+
+        for event, element in events:
+
+            if event == "start":
+                parent_tag = stack[-1] if stack else None
+                tag = XMLTag(element.tag, parent_tag)
+
+                # Handle properties.
+                tag.properties.update(element.attrib)
+
+                if parent_tag is None:
+                    self.__root = tag
+                else:
+                    parent_tag.children.append(tag)
+
+                stack.append(tag)
+                continue
+
+            # Text is only guaranteed to be parsed once element is closed.
+            tag = stack.pop()
 
-        if element.text and len(element.text.strip()) > 0:
-            tag.content = element.text.strip()
+            text = element.text.strip() if element.text else None
 
-        # Handle properties.
-        for key, value in element.items():
-            tag.add(key, value)
+            if text:
+                tag.content = text
 
-        tag.children = [self.__process_xml(child, tag) for child in element]
-        return tag
+            # Element is fully processed, release it.
+            element.clear()
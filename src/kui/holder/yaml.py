@@ -1,12 +1,19 @@
 import os.path
-from typing import Any
+from typing import Any, Optional
 
 import yaml
 from kutil.file import remove_extension_from_path
 from kutil.file_type import YML, YAML
 from kutil.logger import get_logger
 
+# libyaml based loader is used when PyYAML has been built with it.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
 _logger = get_logger(__name__)
+_MISSING = object()
 
 
 class YamlHolder:
@@ -26,25 +33,46 @@ class YamlHolder:
         """
 
         self.__data = {}
+        self.__values: dict[str, Any] = {}
+        config_path = remove_extension_from_path(config_path)
+
+        # Files are opened directly instead of checking
+        # whether they exist first, .yaml is the common case.
+        for file_type in (YAML, YML):
+            try:
+                with open(file_type.add_extension(config_path), "rb") as file:
+                    self.__data = yaml.load(file, Loader=_YamlLoader)
+                    return
+
+            except FileNotFoundError:
+                continue
+
+        _logger.error("KamaUI configuration file is missing.")
+
+    @staticmethod
+    def find_file(config_path: str) -> Optional[str]:
+        """
+        Locates YAML file for the provided path, checking both .yaml and .yml extensions.
+
+        Args:
+            config_path (str): The base path to the configuration file (with or without extension).
 
-        file_path = None
+        Returns:
+            str: Path to the existing file or None if neither of the files exist.
+        """
 
         config_path = remove_extension_from_path(config_path)
-        yml_file_path = YML.add_extension(config_path)
         yaml_file_path = YAML.add_extension(config_path)
 
         if os.path.exists(yaml_file_path):
-            file_path = yaml_file_path
+            return yaml_file_path
 
-        elif os.path.exists(yml_file_path):
-            file_path = yml_file_path
+        yml_file_path = YML.add_extension(config_path)
 
-        if file_path is None:
-            _logger.error("KamaUI configuration file is missing.")
-            return
+        if os.path.exists(yml_file_path):
+            return yml_file_path
 
-        with open(file_path, "r", encoding="utf-8") as file:
-            self.__data = yaml.safe_load(file)
+        return None
 
     def get(self, property_name: str, default_value: Any = None):
         """
@@ -62,14 +90,40 @@ class YamlHolder:
             Any: The resolved value from the configuration or the default_value.
         """
 
-        parts = property_name.split(".")
-        value = self.__data.get(parts.pop(0), {})
+        # Data doesn't change after it's loaded,
+        # so each path is only walked once.
+        value = self.__values.get(property_name, _MISSING)
+
+        if value is _MISSING:
+            value = self.__lookup(property_name)
+            self.__values[property_name] = value
+
+        if value is _MISSING:
+            return default_value
+
+        return value
+
+    def __lookup(self, property_name: str) -> Any:
+        """
+        Walks the nested data using parts of the dot-notated key.
+        Empty sections are treated as missing.
+        """
+
+        value = self.__data or {}
+
+        # Not restricted to plain dicts, so holders
+        # built from dict subclasses keep working.
+        for property_part in property_name.split("."):
+            if not isinstance(value, dict):
+                return _MISSING
+
+            value = value.get(property_part, _MISSING)
 
-        for property_part in parts:
-            value = value.get(property_part, {})
+            if value is _MISSING:
+                return _MISSING
 
         if value == {}:
-            value = default_value
+            return _MISSING
 
         return value
 
@@ -89,8 +143,7 @@ class YamlHolder:
                 key = f"{prefix}{join_char}{key}"
 
             if isinstance(value, dict):
-                child_data = self.to_flat_json(value, join_char, key)
-                formatted_data = {**formatted_data, **child_data}
+                formatted_data.update(self.to_flat_json(value, join_char, key))
 
             else:
                 formatted_data[key] = value
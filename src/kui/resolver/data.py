@@ -1,3 +1,5 @@
+import logging
+
 from kui.core.app import KamaApplication
 from kui.core.resolver import ContentResolver
 from kutil.logger import get_logger
@@ -15,6 +17,12 @@ class DataResolver(ContentResolver):
     only returning values that are explicitly of string type.
     """
 
+    def __init__(self):
+        """
+        Binds the data holder, resolver is invoked for every data token.
+        """
+        self.__data = KamaApplication().data
+
     def resolve(self, key: str, *args, **kw):
         """
         Looks up the provided key in the global data holder and returns its
@@ -30,21 +38,18 @@ class DataResolver(ContentResolver):
                  is missing or not a string.
         """
 
-        application = KamaApplication()
-        data = application.data.get(key)
-        default_value = None
-
-        if len(args) > 0:
-            default_value = args[0]
+        data = self.__data.get(key)
 
-        if data is None:
-            data = default_value
+        if data is None and len(args) > 0:
+            data = args[0]
 
-        if isinstance(data, int) or isinstance(data, float):
+        if isinstance(data, (int, float)):
             data = str(data)
 
         if not isinstance(data, str):
             return None
 
-        _logger.debug("Resolved %s to %s", key, data)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Resolved %s to %s", key, data)
+
         return data
@@ -1,4 +1,5 @@
 import dataclasses
+import os
 from typing import Final
 
 from PyQt6.QtGui import QIcon
@@ -10,6 +11,43 @@ from kutil.logger import get_logger
 
 _logger = get_logger(__name__)
 
+# Loaded icons, keyed by path along with file modification time and size,
+# since dynamic images are regenerated in place on theme change.
+_icons: dict[str, tuple[tuple[int, int], QIcon]] = {}
+
+
+def _invalidate_icons():
+    """
+    Drops loaded icons, so they're created again from files.
+    Should be called once resources are reloaded.
+    """
+    _icons.clear()
+
+
+def _get_icon(file_path: str) -> QIcon:
+    """
+    Returns icon for the provided file, reusing already loaded one if file hasn't changed.
+    """
+
+    try:
+        file_stat = os.stat(file_path)
+        file_signature = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    except OSError:
+        return QIcon(file_path)
+
+    cached_icon = _icons.get(file_path)
+
+    if cached_icon is not None and cached_icon[0] == file_signature:
+        return cached_icon[1]
+
+    _logger.debug("Creating icon for %s", file_path)
+
+    icon = QIcon(file_path)
+    _icons[file_path] = (file_signature, icon)
+
+    return icon
+
 
 @dataclasses.dataclass
 class QIconWrapper:
@@ -65,7 +103,4 @@ class IconResolver(ContentResolver):
         width = kw.get("width") or size
         height = kw.get("height") or size
 
-        icon = QIcon(file_path)
-        _logger.debug("Creating icon for %s", file_path)
-
-        return QIconWrapper(icon, width, height)
+        return QIconWrapper(_get_icon(file_path), width, height)
@@ -7,6 +7,8 @@ class ColorResolver(StyleResolver):
     Resolver for converting color codes into hex strings.
     """
 
+    cacheable = True
+
     def resolve(self, color_code: str):
         """
         Retrieves the hex string for the specified color code.
@@ -31,6 +33,8 @@ class RgbaResolver(StyleResolver):
     Resolver for converting color codes into RGBA strings with custom transparency.
     """
 
+    cacheable = True
+
     def resolve(self, color_code: str, alpha: str):
         """
         Retrieves an RGBA representation of a color code with a specific alpha value.
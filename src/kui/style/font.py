@@ -6,6 +6,8 @@ class FontResolver(StyleResolver):
     Resolver for converting font codes into valid QSS font declarations.
     """
 
+    cacheable = True
+
     def resolve(self, font_code: str):
         """
         Retrieves the QSS font string for the specified font code.
@@ -7,6 +7,8 @@ class ImageResolver(StyleResolver):
     Resolver for converting image identifiers into valid QSS URL strings.
     """
 
+    cacheable = True
+
     def resolve(self, image_name: str):
         """
         Retrieves the absolute path of an image and formats it for QSS.
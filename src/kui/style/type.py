@@ -1,7 +1,7 @@
 import dataclasses
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class KamaColor:
     """
     Represents a single hex color and provides conversion utilities.
@@ -30,7 +30,7 @@ class KamaColor:
         return f"rgba({red}, {green}, {blue}, {alpha})"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class KamaComposedColor:
     """
     Groups a light and dark version of a color under a single identifier.
@@ -54,7 +54,7 @@ class KamaComposedColor:
         return self.variations.get(theme)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class KamaFont:
     """
     Represents font settings and handles QSS formatting.
@@ -82,7 +82,7 @@ class KamaFont:
         return f"{self.font_size}px '{self.font_family}';\n\tfont-weight: {self.font_weight}"
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class DynamicImage:
     """
     Represents an image resource that supports dynamic color injection.
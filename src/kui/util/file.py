@@ -40,22 +40,53 @@ def get_project_dir() -> Path:
     return Path.cwd().resolve()
 
 
-def get_files_from_directory(path: str | Path, recursive: bool = False, extension: str = None):
+def get_file_paths_from_directory(path: str | Path, recursive: bool = False, extension: str = None) -> list[Path]:
+    """
+    Collects paths of the files located in the provided directory.
+
+    Args:
+        path (str | Path): Directory to scan.
+        recursive (bool): Whether nested directories should be scanned as well.
+        extension (str): Optional extension files should end with.
+
+    Returns:
+        list[Path]: Paths of the matching files.
+    """
+
     path = Path(path)
-    content: list[str] = []
+    paths: list[Path] = []
 
     if not path.exists():
-        return content
+        return paths
 
     for entry in path.iterdir():
         if entry.is_dir():
             if recursive:
-                content.extend(get_files_from_directory(entry))
+                paths.extend(get_file_paths_from_directory(entry, recursive, extension))
             continue
 
         if extension is not None and not entry.name.endswith(extension):
             continue
 
-        content.append(entry.read_text(encoding="utf-8"))
+        paths.append(entry)
+
+    return paths
+
+
+def get_files_from_directory(path: str | Path, recursive: bool = False, extension: str = None):
+    """
+    Reads contents of the files located in the provided directory.
+
+    Args:
+        path (str | Path): Directory to scan.
+        recursive (bool): Whether nested directories should be scanned as well.
+        extension (str): Optional extension files should end with.
+
+    Returns:
+        list[str]: Contents of the matching files.
+    """
 
-    return content
+    return [
+        file_path.read_text(encoding="utf-8")
+        for file_path in get_file_paths_from_directory(path, recursive, extension)
+    ]
@@ -5,3 +5,16 @@ from kutil.pytest_plugin import get_module_patch
 @pytest.fixture
 def module_patch(get_module_patch):
     return get_module_patch("kui")
+
+
+@pytest.fixture(autouse=True)
+def _reset_shortcuts():
+    """
+    Prevents application and its services remembered
+    by shortcuts from leaking between tests.
+    """
+
+    yield
+
+    from kui.core.shortcut import _invalidate_shortcuts
+    _invalidate_shortcuts()
@@ -0,0 +1,272 @@
+import os
+from unittest.mock import Mock
+
+import pytest
+
+
+_LAYOUT = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<KamaSection name="main" label="Main">
+    <!-- Header of the section. -->
+    <KamaWidget id="header" layout="horizontal" alignment="left-top" recursive_refresh_events="refresh">
+        <KamaLabel arg_key="title" arg_list_values="a b">Café</KamaLabel>
+        <Template>
+            <Body>
+                <KamaLabel tooltip="Body"/>
+            </Body>
+        </Template>
+    </KamaWidget>
+</KamaSection>
+"""
+
+
+def _state(value):
+    """
+    Converts resources into comparable structure of plain values.
+    """
+
+    if isinstance(value, (list, tuple)):
+        return [_state(item) for item in value]
+
+    if isinstance(value, dict):
+        return {key: _state(item) for key, item in value.items()}
+
+    if hasattr(value, "__dict__"):
+        return type(value).__name__, _state(vars(value))
+
+    return value
+
+
+class TestResourceReader:
+
+    @pytest.fixture
+    def project_dir(self, tmp_path):
+        """
+        Creates project with a single layout and color resources.
+        """
+
+        layouts_dir = tmp_path / "Layouts"
+        resources_dir = tmp_path / "Resources"
+
+        layouts_dir.mkdir()
+        resources_dir.mkdir()
+
+        (layouts_dir / "main.kml").write_bytes(_LAYOUT.encode("latin-1"))
+        (resources_dir / "colors.yaml").write_text("light:\n  primary: '#ffffff'\n", encoding="utf-8")
+
+        return tmp_path
+
+    @pytest.fixture
+    def create_reader(self, project_dir):
+        """
+        Creates readers sharing the same project and cache file.
+        """
+
+        def create_reader():
+            from kui.core.service.reader import ResourceReader
+
+            context = Mock()
+            discovery = context.application.discovery
+
+            discovery.cache.return_value = str(project_dir / "resources.pkl")
+            discovery.layouts.return_value = str(project_dir / "Layouts")
+            discovery.resources.side_effect = lambda name: str(project_dir / "Resources" / name)
+            discovery.Locales = str(project_dir / "Locales")
+
+            return ResourceReader(context), context.application
+
+        return create_reader
+
+    @pytest.fixture
+    def yaml_holder(self, monkeypatch):
+        from kui.core.service import reader
+        from kui.holder.yaml import YamlHolder
+
+        holder_mock = Mock(wraps=YamlHolder)
+        monkeypatch.setattr(reader, "YamlHolder", holder_mock)
+
+        return holder_mock
+
+    @pytest.fixture
+    def xml_holder(self, monkeypatch):
+        from kui.core.service import reader
+        from kui.holder.xml import XMLHolder
+
+        holder_mock = Mock(wraps=XMLHolder)
+        monkeypatch.setattr(reader, "XMLHolder", holder_mock)
+
+        return holder_mock
+
+    @staticmethod
+    def get_colors(application):
+        return [call.args[0] for call in application.style.add_color.call_args_list]
+
+    @staticmethod
+    def get_sections(application):
+        return _state([call.args for call in application.window.manager.add_section.call_args_list])
+
+    def test_cache_hit(self, create_reader, yaml_holder, xml_holder):
+        """
+        Checks that unchanged files are not parsed again by the next reader.
+        """
+
+        reader, application = create_reader()
+        reader.read()
+
+        assert yaml_holder.call_count == 3
+        assert xml_holder.call_count == 1
+
+        reader, cached_application = create_reader()
+        reader.read()
+
+        # Only missing files are read again.
+        assert yaml_holder.call_count == 5
+        assert xml_holder.call_count == 1
+        assert self.get_colors(cached_application) == self.get_colors(application)
+
+    def test_cache_miss_after_file_change(self, create_reader, project_dir, yaml_holder):
+        """
+        Checks that changed file is parsed again.
+        """
+
+        reader, _ = create_reader()
+        reader.read()
+
+        colors_path = project_dir / "Resources" / "colors.yaml"
+        colors_path.write_text("light:\n  primary: '#000000'\n  secondary: '#ffffff'\n", encoding="utf-8")
+
+        reader, application = create_reader()
+        reader.read()
+
+        assert yaml_holder.call_count == 6
+        assert [color.color_code for color in self.get_colors(application)] == ["primary", "secondary"]
+
+    def test_cache_miss_after_file_touch(self, create_reader, project_dir, xml_holder):
+        """
+        Checks that file with changed modification time is parsed again, producing the same resources.
+        """
+
+        reader, application = create_reader()
+        reader.read()
+
+        layout_path = project_dir / "Layouts" / "main.kml"
+        layout_stat = layout_path.stat()
+        os.utime(layout_path, ns=(layout_stat.st_atime_ns, layout_stat.st_mtime_ns + 1_000_000_000))
+
+        reader, touched_application = create_reader()
+        reader.read()
+
+        assert xml_holder.call_count == 2
+        assert self.get_sections(touched_application) == self.get_sections(application)
+
+    def test_corrupted_cache(self, create_reader, project_dir, xml_holder):
+        """
+        Checks that corrupted cache file is ignored and rebuilt.
+        """
+
+        cache_path = project_dir / "resources.pkl"
+
+        reader, _ = create_reader()
+        reader.read()
+
+        cache_path.write_bytes(b"corrupted")
+
+        reader, application = create_reader()
+        reader.read()
+
+        assert xml_holder.call_count == 2
+        assert len(application.window.manager.add_section.call_args_list) == 2
+
+        reader, _ = create_reader()
+        reader.read()
+
+        assert xml_holder.call_count == 2
+
+    def test_cache_of_different_version(self, create_reader, monkeypatch, xml_holder):
+        """
+        Checks that cache created by a different version is discarded.
+        """
+
+        from kui.core.service import reader as reader_module
+
+        reader, _ = create_reader()
+        reader.read()
+
+        monkeypatch.setattr(reader_module, "_get_cache_version", lambda: ("0.0.0", 0))
+
+        reader, _ = create_reader()
+        reader.read()
+
+        assert xml_holder.call_count == 2
+
+    def test_cache_without_version(self, create_reader, project_dir, monkeypatch, xml_holder):
+        """
+        Checks that cache is neither used nor saved when its version can't be determined.
+        """
+
+        from kui.core.service import reader as reader_module
+
+        monkeypatch.setattr(reader_module, "_get_cache_version", lambda: None)
+
+        reader, _ = create_reader()
+        reader.read()
+
+        reader, _ = create_reader()
+        reader.read()
+
+        assert xml_holder.call_count == 2
+        assert not (project_dir / "resources.pkl").exists()
+
+    def test_parser_fingerprint(self, tmp_path):
+        """
+        Checks that fingerprint changes with parser sources and is absent if they can't be accessed.
+        """
+
+        from kui.core.service.reader import _get_parser_fingerprint
+
+        source_path = tmp_path / "parser.py"
+        source_path.write_text("VALUE = 1\n", encoding="utf-8")
+        os.utime(source_path, ns=(1_000_000_000, 1_000_000_000))
+
+        fingerprint = _get_parser_fingerprint([str(source_path)])
+        assert fingerprint == _get_parser_fingerprint([str(source_path)])
+
+        source_path.write_text("VALUE = 10\n", encoding="utf-8")
+        os.utime(source_path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert _get_parser_fingerprint([str(source_path)]) != fingerprint
+        assert _get_parser_fingerprint([str(tmp_path / "missing.py")]) is None
+        assert _get_parser_fingerprint([None]) is None
+
+    def test_cache_with_unexpected_class(self, create_reader, project_dir, xml_holder):
+        """
+        Checks that cache referencing classes other than cached resources is not restored.
+        """
+
+        import pickle
+        from kui.core.service.reader import _get_cache_version
+
+        cache_path = project_dir / "resources.pkl"
+        cache_path.write_bytes(pickle.dumps({"version": _get_cache_version(), "entries": {"key": Mock}}))
+
+        reader, application = create_reader()
+        reader.read()
+
+        assert xml_holder.call_count == 1
+        assert len(application.window.manager.add_section.call_args_list) == 2
+
+    def test_cached_and_fresh_read_are_the_same(self, create_reader):
+        """
+        Checks that widget manager receives the same sections
+        and metadata whether layout is parsed or restored from cache.
+        """
+
+        reader, application = create_reader()
+        reader.read()
+
+        reader, cached_application = create_reader()
+        reader.read()
+
+        sections = self.get_sections(application)
+
+        assert [section[0].section_id for section in sections] == ["header__template_body", "main"]
+        assert self.get_sections(cached_application) == sections
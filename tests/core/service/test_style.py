@@ -0,0 +1,89 @@
+from unittest.mock import Mock
+
+import pytest
+
+
+class TestStyleBuilder:
+
+    @pytest.fixture
+    def builder(self):
+        from kui.core.service.style import StyleBuilder
+        return StyleBuilder(Mock())
+
+    @staticmethod
+    def create_stylesheet(path, selector: str):
+        """
+        Creates stylesheet file with a single block.
+        """
+
+        from kutil.file_type import KSS
+
+        path = path.parent / KSS.add_extension(path.name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{selector} {{ color: red; }}", encoding="utf-8")
+
+    def test_stylesheets_are_ordered_by_path(self, builder, tmp_path):
+        """
+        Checks that stylesheets are concatenated in order of
+        their path components regardless of creation order.
+        """
+
+        self.create_stylesheet(tmp_path / "theme", "Theme")
+        self.create_stylesheet(tmp_path / "base" / "widget", "BaseWidget")
+        self.create_stylesheet(tmp_path / "base" / "button", "BaseButton")
+        self.create_stylesheet(tmp_path / "base-dark", "BaseDark")
+        self.create_stylesheet(tmp_path / "base" / "nested" / "label", "BaseNestedLabel")
+
+        style_blocks = builder.load_stylesheet(str(tmp_path))
+
+        assert [block.selector for block in style_blocks] == [
+            "BaseButton",
+            "BaseNestedLabel",
+            "BaseWidget",
+            "BaseDark",
+            "Theme",
+        ]
+
+    def test_custom_resolver_is_evaluated_every_time(self, builder):
+        """
+        Checks that resolvers which didn't opt in to caching are called on every resolve.
+        """
+
+        from kui.core.style import StyleResolver
+
+        class CounterResolver(StyleResolver):
+
+            def __init__(self):
+                super().__init__()
+                self.calls = 0
+
+            def resolve(self, *args) -> str:
+                self.calls += 1
+                return str(self.calls)
+
+        resolver = CounterResolver()
+        builder.add_resolver(resolver)
+
+        assert builder.resolve("counter(value)") == "1"
+        assert builder.resolve("counter(value)") == "2"
+        assert resolver.calls == 2
+
+    def test_cacheable_resolver_is_evaluated_once(self, builder):
+        """
+        Checks that values of cacheable resolvers are reused until cache is cleared.
+        """
+
+        from kui.style.color import ColorResolver
+
+        builder.add_resolver(ColorResolver())
+        get_color = builder.application.style.get_color
+        get_color.return_value.color_hex = "#ffffff"
+
+        assert builder.resolve("color(primary)") == "#ffffff"
+        assert builder.resolve("color(primary)") == "#ffffff"
+        get_color.assert_called_once_with("primary")
+
+        builder.clear_cache()
+        builder.resolve("color(primary)")
+
+        assert get_color.call_count == 2
@@ -0,0 +1,76 @@
+from unittest.mock import Mock
+
+import pytest
+
+
+class TestTextResourceService:
+
+    @pytest.fixture
+    def service(self):
+        """
+        Creates service with application that defaults to 'en_US' locale.
+        """
+
+        from kui.core.service.tr import TextResourceService
+
+        context = Mock()
+        context.application.config.default_locale = "en_US"
+
+        return TextResourceService(context)
+
+    @staticmethod
+    def create_resource(key: str, **texts):
+        """
+        Creates text resource with translation for each provided locale.
+        """
+
+        from kamatr.resource import TextResource, TextTranslation
+
+        translations = [TextTranslation(locale=locale, text=text) for locale, text in texts.items()]
+        return TextResource(key, translations)
+
+    def test_default_locale(self, service):
+        """
+        Checks that application default locale is used when locale is not set.
+        """
+
+        service.add(self.create_resource("greeting", en_US="Hello"))
+
+        assert service.locale == "en_US"
+        assert service.get("greeting") == "Hello"
+
+    def test_locale_switch_and_added_resource(self, service):
+        """
+        Checks that translations are up to date after locale switch and resource change.
+        """
+
+        service.add(self.create_resource("greeting", en_US="Hello", uk_UA="Привіт"))
+        assert service.get("greeting") == "Hello"
+
+        service.locale = "uk_UA"
+        assert service.locale == "uk_UA"
+        assert service.get("greeting") == "Привіт"
+
+        service.add(self.create_resource("greeting", en_US="Hi", uk_UA="Вітаю"))
+        assert service.get("greeting") == "Вітаю"
+
+        service.locale = "en_US"
+        assert service.get("greeting") == "Hi"
+
+    @pytest.mark.parametrize("mutate", [
+        pytest.param(lambda service, resource: setattr(service, "locale", "uk_UA"), id="locale"),
+        pytest.param(lambda service, resource: service.add(resource), id="add"),
+    ])
+    def test_cache_is_dropped_after_mutation(self, service, mutate):
+        """
+        Checks that remembered translations are dropped by every mutating API of the service.
+        """
+
+        service.add(self.create_resource("greeting", en_US="Hello", uk_UA="Привіт"))
+        service.get("greeting")
+
+        assert service._TextResourceService__cache
+
+        mutate(service, self.create_resource("farewell", en_US="Bye", uk_UA="Бувай"))
+
+        assert service._TextResourceService__cache == {}
@@ -0,0 +1,86 @@
+import pytest
+
+
+class TestResolveContent:
+
+    @pytest.fixture
+    def resolvers(self):
+        """
+        Provides resolvers that record received keyword
+        arguments and return predefined objects.
+        """
+
+        from kui.core.resolver import ContentResolver
+
+        class EchoResolver(ContentResolver):
+
+            def __init__(self):
+                self.kw = None
+
+            def resolve(self, value: str, *args, **kw):
+                self.kw = kw
+                return value
+
+        class ValueResolver(ContentResolver):
+
+            values = {
+                "none": None,
+                "float": 2.5,
+                "list": [1, 2],
+                "dict": {"key": 1}
+            }
+
+            def resolve(self, value: str, *args, **kw):
+                return self.values[value]
+
+        return {
+            "echoresolver": EchoResolver(),
+            "valueresolver": ValueResolver()
+        }
+
+    @pytest.mark.parametrize("raw_value, expected_value", [
+        ("12", 12),
+        ("-12", -12),
+        ("0", 0),
+        ("1.5", "1.5"),
+        ("-", "-"),
+        ("--1", "--1"),
+        ("abc", "abc"),
+    ])
+    def test_string_values_are_converted_when_integer(self, resolvers, raw_value, expected_value):
+        """
+        Checks that only integer-like keyword values are converted to int.
+        """
+
+        from kui.core.resolver import resolve_content
+
+        resolve_content(f"echo{{text, size: {raw_value}}}", resolvers)
+
+        assert resolvers["echoresolver"].kw == {"size": expected_value}
+
+    @pytest.mark.parametrize("value_name, expected_value", [
+        ("float", 2.5),
+        ("list", [1, 2]),
+        ("dict", {"key": 1}),
+    ])
+    def test_object_values_are_passed_as_is(self, resolvers, value_name, expected_value):
+        """
+        Checks that keyword values resolved from nested tokens are not converted.
+        """
+
+        from kui.core.resolver import resolve_content
+
+        resolve_content(f"echo{{text, size: value{{{value_name}}}}}", resolvers)
+
+        assert resolvers["echoresolver"].kw == {"size": expected_value}
+
+    def test_empty_nested_value_is_passed_as_string(self, resolvers):
+        """
+        Checks that nested token resolved to nothing doesn't break conversion.
+        """
+
+        from kui.core.resolver import resolve_content
+
+        resolve_content("echo{text, size: value{none}}", resolvers)
+
+        assert resolvers["echoresolver"].kw == {"size": ""}
@@ -0,0 +1,51 @@
+from unittest.mock import MagicMock
+
+
+class TestShortcuts:
+
+    def test_application_is_looked_up_once(self, module_patch):
+        """
+        Checks that application instance is remembered between shortcut calls.
+        """
+
+        from kui.core.shortcut import prop
+
+        application_mock = module_patch("KamaApplication")
+
+        prop("application.name")
+        prop("application.author")
+
+        application_mock.assert_called_once()
+
+    def test_invalidate_shortcuts(self, module_patch):
+        """
+        Checks that application is looked up again after shortcuts are invalidated.
+        """
+
+        from kui.core.shortcut import prop, _invalidate_shortcuts
+
+        application_mock = module_patch("KamaApplication")
+
+        prop("application.name")
+        _invalidate_shortcuts()
+        prop("application.name")
+
+        assert application_mock.call_count == 2
+
+    def test_translate_is_reset_with_shortcuts(self, module_patch):
+        """
+        Checks that translations of replaced application are not used after invalidation.
+        """
+
+        from kui.core.shortcut import tr, _invalidate_shortcuts
+
+        application_mock = module_patch("KamaApplication")
+        application_mock.return_value.translations.get.return_value = "Old"
+
+        assert tr("greeting") == "Old"
+
+        _invalidate_shortcuts()
+        application_mock.return_value = MagicMock()
+        application_mock.return_value.translations.get.return_value = "New"
+
+        assert tr("greeting") == "New"
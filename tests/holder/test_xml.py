@@ -0,0 +1,83 @@
+class TestXMLHolder:
+
+    def test_attributes(self):
+        """
+        Checks that attributes are collected as tag properties.
+        """
+
+        from kui.holder.xml import XMLHolder
+
+        root = XMLHolder('<Widget id="title" width="120"/>').root
+
+        assert root.name == "Widget"
+        assert root.properties == {"id": "title", "width": "120"}
+        assert root.get("width") == 120
+        assert root.get("missing", "default") == "default"
+
+    def test_text(self):
+        """
+        Checks that tag text is stripped and empty text is ignored.
+        """
+
+        from kui.holder.xml import XMLHolder
+
+        root = XMLHolder("<Root><Label>  Hello  </Label><Empty>   </Empty></Root>").root
+        label, empty = root.children
+
+        assert label.content == "Hello"
+        assert empty.content is None
+        assert root.content is None
+
+    def test_nesting(self):
+        """
+        Checks that children are kept in document order with their parents.
+        """
+
+        from kui.holder.xml import XMLHolder
+
+        root = XMLHolder("<Root><First><Inner/></First><Second/></Root>").root
+        first, second = root.children
+
+        assert root.parent is None
+        assert [child.name for child in root.children] == ["First", "Second"]
+        assert first.parent is root
+        assert second.parent is root
+        assert [child.name for child in first.children] == ["Inner"]
+        assert first.children[0].parent is first
+        assert second.children == []
+
+    def test_comments(self):
+        """
+        Checks that comments are neither children nor content.
+        """
+
+        from kui.holder.xml import XMLHolder
+
+        root = XMLHolder("<Root><!-- comment --><Child/><!-- another --></Root>").root
+
+        assert [child.name for child in root.children] == ["Child"]
+        assert root.content is None
+
+    def test_declared_encoding_bytes(self):
+        """
+        Checks that raw content is decoded using declared encoding.
+        """
+
+        from kui.holder.xml import XMLHolder
+
+        latin_content = '<?xml version="1.0" encoding="ISO-8859-1"?><Label text="café"/>'.encode("latin-1")
+        utf16_content = '<?xml version="1.0" encoding="UTF-16"?><Label text="café"/>'.encode("utf-16")
+
+        assert XMLHolder(latin_content).root.get("text") == "café"
+        assert XMLHolder(utf16_content).root.get("text") == "café"
+
+    def test_declared_encoding_str(self):
+        """
+        Checks that decoded content with encoding declaration can be parsed.
+        """
+
+        from kui.holder.xml import XMLHolder
+
+        content = '<?xml version="1.0" encoding="ISO-8859-1"?>\n<Label text="café"/>'
+
+        assert XMLHolder(content).root.get("text") == "café"
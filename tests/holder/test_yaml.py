@@ -0,0 +1,77 @@
+import pytest
+
+
+class TestYamlHolder:
+
+    @pytest.fixture
+    def holder(self, tmp_path):
+        """
+        Creates holder from YAML file with nested, empty and non-string keys.
+        """
+
+        from kui.holder.yaml import YamlHolder
+
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(
+            "application:\n"
+            "  name: Demo\n"
+            "  window:\n"
+            "    width: 800\n"
+            "  empty: {}\n"
+            "  nothing: null\n"
+            "1: numeric\n"
+            "sizes:\n"
+            "  10: small\n",
+            encoding="utf-8"
+        )
+
+        return YamlHolder(str(tmp_path / "config"))
+
+    def test_nested_lookup(self, holder):
+        """
+        Checks that nested values and sections are reachable using dot-notation.
+        """
+
+        assert holder.get("application.name") == "Demo"
+        assert holder.get("application.window.width") == 800
+        assert holder.get("application.window") == {"width": 800}
+
+    def test_missing_lookup(self, holder):
+        """
+        Checks that default value is returned for missing paths.
+        """
+
+        assert holder.get("application.missing") is None
+        assert holder.get("application.missing", "default") == "default"
+        assert holder.get("missing.name", "default") == "default"
+        assert holder.get("application.name.length", "default") == "default"
+
+    def test_repeated_lookup_uses_provided_default(self, holder):
+        """
+        Checks that default value of each call is used for the same missing path.
+        """
+
+        assert holder.get("application.missing", "first") == "first"
+        assert holder.get("application.missing", "second") == "second"
+
+    def test_empty_dict_lookup(self, holder):
+        """
+        Checks that empty sections are treated as missing.
+        """
+
+        assert holder.get("application.empty", "default") == "default"
+
+    def test_null_lookup(self, holder):
+        """
+        Checks that explicit null values are returned as is.
+        """
+
+        assert holder.get("application.nothing", "default") is None
+
+    def test_non_str_key_lookup(self, holder):
+        """
+        Checks that values stored under non-string keys are not reachable.
+        """
+
+        assert holder.get("1", "default") == "default"
+        assert holder.get("sizes.10", "default") == "default"
@@ -0,0 +1,72 @@
+import os
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+
+class TestIconCache:
+
+    @pytest.fixture
+    def _qt_app(self):
+        """
+        Ensures a QApplication instance exists for all tests involving Qt objects.
+        """
+
+        app = QApplication.instance()
+
+        if app is None:
+            app = QApplication([])
+
+        yield app
+
+    @pytest.fixture
+    def icon_path(self, tmp_path):
+        """
+        Creates icon file, keeping its modification time fixed between rewrites.
+        """
+
+        icon_path = tmp_path / "icon.svg"
+        icon_path.write_text("<svg/>", encoding="utf-8")
+        os.utime(icon_path, ns=(1_000_000_000, 1_000_000_000))
+
+        yield str(icon_path)
+
+        from kui.resolver.icon import _invalidate_icons
+        _invalidate_icons()
+
+    def test_icon_is_reused(self, _qt_app, icon_path):
+        """
+        Checks that icon of unchanged file is created only once.
+        """
+
+        from kui.resolver.icon import _get_icon
+
+        assert _get_icon(icon_path) is _get_icon(icon_path)
+
+    def test_icon_is_recreated_when_size_changes(self, _qt_app, icon_path):
+        """
+        Checks that rewritten file is detected by its size even if modification time is the same.
+        """
+
+        from kui.resolver.icon import _get_icon
+
+        icon = _get_icon(icon_path)
+
+        with open(icon_path, "w", encoding="utf-8") as file:
+            file.write('<svg width="10"/>')
+
+        os.utime(icon_path, ns=(1_000_000_000, 1_000_000_000))
+
+        assert _get_icon(icon_path) is not icon
+
+    def test_invalidate_icons(self, _qt_app, icon_path):
+        """
+        Checks that icons are created again once cache is invalidated.
+        """
+
+        from kui.resolver.icon import _get_icon, _invalidate_icons
+
+        icon = _get_icon(icon_path)
+        _invalidate_icons()
+
+        assert _get_icon(icon_path) is not icon